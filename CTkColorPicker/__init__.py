@@ -7,7 +7,42 @@ Homepage: https://github.com/Akascape/CTkColorPicker
 
 __version__ = "0.8.0"
 
-from .ctk_color_picker import AskColor as AskColor
-from .ctk_color_picker_widget import CTkColorPicker as CTkColorPicker
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["AskColor", "CTkColorPicker", "__version__"]
+if TYPE_CHECKING:
+    from .ctk_color_picker import AskColor as AskColor
+    from .ctk_color_picker_widget import CTkColorPicker as CTkColorPicker
+    from .lazy_color_picker import LazyColorPicker as LazyColorPicker
+    from .swatch_grid import SwatchGrid as SwatchGrid
+
+__all__ = [
+    "AskColor",
+    "CTkColorPicker",
+    "LazyColorPicker",
+    "SwatchGrid",
+    "__version__",
+]
+
+# The widgets pull in tkinter, customtkinter and Pillow, so they are only
+# imported when first accessed and the color helpers stay cheap to import.
+_LAZY = {
+    "AskColor": ".ctk_color_picker",
+    "CTkColorPicker": ".ctk_color_picker_widget",
+    "LazyColorPicker": ".lazy_color_picker",
+    "SwatchGrid": ".swatch_grid",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
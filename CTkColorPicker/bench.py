@@ -0,0 +1,661 @@
+"""Performance benchmarks: ``python -m CTkColorPicker.bench``.
+
+Runs a set of micro and widget benchmarks, prints a JSON report and
+optionally compares it against a saved baseline. Widget benchmarks need a
+display; on Linux without ``DISPLAY`` a private ``Xvfb`` server is started
+when one is installed, otherwise those benchmarks are reported as skipped.
+
+Examples
+--------
+Save a baseline, then check a later build against it::
+
+    python -m CTkColorPicker.bench --output baseline.json
+    python -m CTkColorPicker.bench --baseline baseline.json --threshold 0.25
+
+The exit status is ``1`` when a metric regressed by more than its threshold.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, Sequence
+
+DEFAULT_WIDTHS = (200, 300, 400)
+"""Picker widths measured by the widget benchmarks."""
+
+DEFAULT_THRESHOLD = 0.25
+"""Allowed relative slowdown before a metric counts as a regression."""
+
+DRAG_EVENTS = 2000
+"""Synthetic motion events sent per drag benchmark."""
+
+BATCH_SIZE = 100_000
+"""Number of colors converted by the batch benchmarks."""
+
+LAZY_ROWS = 500
+"""Rows of collapsed :class:`LazyColorPicker` created by the grid benchmark."""
+
+EYEDROPPER_FRAMES = 100
+"""Loupe frames rendered by the eyedropper benchmark."""
+
+HEAVY_MODULES = ("tkinter", "customtkinter", "PIL", "numpy")
+"""Dependencies that importing the package or its color helpers must not
+load until a widget or an image function is used."""
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, len(heavy))
+"""
+
+
+def _metric(value: float, unit: str, better: str = "lower") -> dict[str, Any]:
+    """Return a report entry; ``better`` is ``"lower"`` or ``"higher"``."""
+
+    return {"value": value, "unit": unit, "better": better}
+
+
+def _median_time(function: Callable[[], Any], repeat: int) -> float:
+    """Return the median wall time of ``function`` in seconds."""
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _drag_path(size: int, count: int) -> list[SimpleNamespace]:
+    """Return ``count`` synthetic motion events circling inside and outside
+    a ``size`` pixel wheel."""
+
+    c = size / 2
+    events = []
+    for i in range(count):
+        angle = i * 0.05
+        radius = c * (0.2 + 1.0 * ((i % 97) / 97))
+        events.append(
+            SimpleNamespace(
+                x=int(c + radius * math.cos(angle)), y=int(c - radius * math.sin(angle))
+            )
+        )
+    return events
+
+
+def start_xvfb() -> subprocess.Popen | None:
+    """Start a private ``Xvfb`` server if there is no display.
+
+    Returns
+    -------
+    subprocess.Popen | None
+        The server process, or ``None`` if a display is already available or
+        ``Xvfb`` is not installed.
+    """
+
+    if sys.platform in ("win32", "darwin") or os.environ.get("DISPLAY"):
+        return None
+    executable = shutil.which("Xvfb")
+    if executable is None:
+        return None
+    for number in range(99, 199):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            continue
+        process = subprocess.Popen(
+            [
+                executable,
+                f":{number}",
+                "-screen",
+                "0",
+                "1280x1024x24",
+                "-nolisten",
+                "tcp",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for _ in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                os.environ["DISPLAY"] = f":{number}"
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+        process.terminate()
+        process.wait()
+    return None
+
+
+def bench_imports(repeat: int) -> dict[str, dict[str, Any]]:
+    """Time importing the package and its helpers in fresh interpreters.
+
+    Also counts the :data:`HEAVY_MODULES` each import loads, which must
+    stay at zero.
+    """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])),
+    )
+    results = {}
+    for label, module in (
+        ("package", __package__),
+        ("color_utils", f"{__package__}.color_utils"),
+        ("picker_model", f"{__package__}.picker_model"),
+    ):
+        code = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        times = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                env=env,
+                text=True,
+            ).stdout.split()
+            times.append(float(output[0]))
+        results[f"import_{label}"] = _metric(statistics.median(times), "s")
+        results[f"import_{label}_heavy_modules"] = _metric(int(output[1]), "modules")
+    return results
+
+
+def bench_lookup(repeat: int) -> dict[str, dict[str, Any]]:
+    """Time :func:`build_hue_to_angle_lookup` on the bundled wheel image."""
+
+    from PIL import Image
+
+    from . import color_utils
+    from .wheel_assets import PATH
+
+    with Image.open(os.path.join(PATH, "color_wheel.png")) as img:
+        image = img.resize((300, 300), Image.Resampling.LANCZOS)
+    results = {
+        "lookup_build": _metric(
+            _median_time(lambda: color_utils.build_hue_to_angle_lookup(image), repeat),
+            "s",
+        )
+    }
+    results["lookup_build_python"] = _metric(
+        _median_time(
+            lambda: color_utils._build_hue_to_angle_lookup_python(image, 1024, 0.985),
+            repeat,
+        ),
+        "s",
+    )
+    return results
+
+
+def bench_model(widths: Sequence[int], repeat: int) -> dict[str, dict[str, Any]]:
+    """Measure the Tk-free drag and hex paths of :class:`PickerModel`."""
+
+    from .picker_model import (
+        DEFAULT_PLACEMENT_CACHE_SIZE,
+        PickerModel,
+        clear_placement_cache,
+    )
+    from .wheel_renderer import HAS_NUMPY
+
+    results = {}
+    for width in widths:
+        size = width - 100
+        events = _drag_path(size, DRAG_EVENTS)
+        models = [("geometric", PickerModel(size))]
+        if HAS_NUMPY:
+            oklch = PickerModel(size, color_space="oklch")
+            # Pickers render the wheel at the slider's lightness before any drag.
+            oklch.index.render(oklch.brightness)
+            models.append(("oklch", oklch))
+        for name, model in models:
+
+            def drag() -> None:
+                for event in events:
+                    model.move_to(event.x, event.y)
+
+            seconds = _median_time(drag, repeat)
+            results[f"model_drag_{name}_{width}"] = _metric(
+                len(events) / seconds, "events/s", "higher"
+            )
+
+            def slide() -> None:
+                for brightness in range(256):
+                    model.set_brightness(brightness)
+
+            seconds = _median_time(slide, repeat)
+            results[f"model_slider_{name}_{width}"] = _metric(
+                256 / seconds, "events/s", "higher"
+            )
+
+        model = PickerModel(size)
+        # Fewer colors than the placement cache holds, so warm runs only hit.
+        colors = [
+            f"#{(i * 2654435761) & 0xFFFFFF:06x}"
+            for i in range(DEFAULT_PLACEMENT_CACHE_SIZE // 2)
+        ]
+
+        def set_colors() -> None:
+            for color in colors:
+                model.set_hex(color)
+
+        def set_colors_cold() -> None:
+            clear_placement_cache()
+            set_colors()
+
+        results[f"model_set_hex_cold_{width}"] = _metric(
+            _median_time(set_colors_cold, repeat) / len(colors), "s"
+        )
+        set_colors()
+        results[f"model_set_hex_warm_{width}"] = _metric(
+            _median_time(set_colors, repeat) / len(colors), "s"
+        )
+    return results
+
+
+def bench_nearest(repeat: int) -> dict[str, dict[str, Any]]:
+    """Measure nearest-color queries against the CSS named colors."""
+
+    from PIL import Image
+
+    from .nearest_color import css_color_index
+
+    # Resolving a color name makes Pillow cache it in its colormap as a
+    # tuple; the index must still build afterwards.
+    Image.new("RGB", (2, 2), "white")
+    index = css_color_index()
+    colors = [((i * 2654435761) & 0xFFFFFF).to_bytes(3, "big") for i in range(1000)]
+
+    def query() -> None:
+        for color in colors:
+            index.nearest(color)
+
+    results = {
+        "nearest_build": _metric(_median_time(css_color_index.__wrapped__, repeat), "s")
+    }
+    query()
+    results["nearest_query"] = _metric(_median_time(query, repeat) / len(colors), "s")
+    return results
+
+
+def bench_batch(repeat: int) -> dict[str, dict[str, Any]]:
+    """Compare the batch conversions with loops over the scalar helpers."""
+
+    from . import color_batch, color_utils
+
+    if color_batch.np is None:
+        return {}
+    np = color_batch.np
+    rgb = np.random.default_rng(0).integers(0, 256, (BATCH_SIZE, 3), dtype=np.uint8)
+    hexes = color_batch.rgb_to_hex_batch(rgb).tolist()
+    rgb_list = rgb.tolist()
+    hsv = color_batch.rgb_to_hsv_batch(rgb)
+    hsv_list = hsv.tolist()
+
+    cases = {
+        "normalize_hex": (
+            lambda: [color_utils.normalize_hex(h) for h in hexes],
+            lambda: color_batch.normalize_hex_batch(hexes),
+        ),
+        "rgb_to_hsv": (
+            lambda: [color_utils.rgb_to_hsv(*c) for c in rgb_list],
+            lambda: color_batch.rgb_to_hsv_batch(rgb),
+        ),
+        "hsv_to_rgb": (
+            lambda: [color_utils.hsv_to_rgb(*c) for c in hsv_list],
+            lambda: color_batch.hsv_to_rgb_batch(hsv),
+        ),
+    }
+    results = {}
+    for name, (scalar, batch) in cases.items():
+        scalar_time = _median_time(scalar, max(1, repeat // 2))
+        batch_time = _median_time(batch, repeat)
+        results[f"batch_{name}"] = _metric(
+            BATCH_SIZE / batch_time, "colors/s", "higher"
+        )
+        results[f"batch_{name}_speedup"] = _metric(
+            scalar_time / batch_time, "x", "higher"
+        )
+    return results
+
+
+def bench_widgets(widths: Sequence[int], repeat: int) -> dict[str, dict[str, Any]]:
+    """Construction, drag, slider, rescale, resize, hex input, eyedropper and
+    memory benchmarks.
+
+    Memory is the Python heap growth per instance reported by
+    :mod:`tracemalloc`; allocations made inside Tk are not included.
+    """
+
+    import customtkinter
+
+    from . import AskColor, CTkColorPicker, LazyColorPicker, picker_model, wheel_assets
+
+    root = customtkinter.CTk()
+    root.withdraw()
+
+    def make(cls: type, width: int) -> Any:
+        if cls is AskColor:
+            widget = AskColor(width=width)
+        else:
+            widget = CTkColorPicker(root, width=width)
+            widget.pack()
+        widget.update_idletasks()
+        return widget
+
+    def close(widget: Any) -> None:
+        if isinstance(widget, AskColor):
+            widget._on_closing()
+        else:
+            widget.destroy()
+        root.update_idletasks()
+
+    def lazy_grid() -> None:
+        frame = customtkinter.CTkFrame(root)
+        for i in range(LAZY_ROWS):
+            LazyColorPicker(frame, initial_color=f"#{i * 2654435761 & 0xFFFFFF:06x}")
+        frame.update_idletasks()
+        frame.destroy()
+
+    results = {}
+    try:
+        results[f"lazy_grid_{LAZY_ROWS}_construct"] = _metric(
+            _median_time(lazy_grid, repeat), "s"
+        )
+
+        picker = make(CTkColorPicker, widths[0])
+        eyedropper = picker.pick_from_screen()
+
+        def eyedropper_frames() -> None:
+            for _ in range(EYEDROPPER_FRAMES):
+                eyedropper._frame()
+            root.update_idletasks()
+
+        results["eyedropper_frame"] = _metric(
+            _median_time(eyedropper_frames, repeat) / EYEDROPPER_FRAMES, "s"
+        )
+        eyedropper.cancel()
+        close(picker)
+
+        picker = CTkColorPicker(root, width=widths[0], with_alpha=True)
+        picker.pack()
+        picker.update_idletasks()
+        for name, variable, update in (
+            ("brightness", picker.brightness_slider_value, picker.update_colors),
+            ("alpha", picker.alpha_slider_value, picker.update_alpha),
+        ):
+
+            def slide() -> None:
+                for value in range(255, -1, -1):
+                    variable.set(value)
+                    update()
+                root.update_idletasks()
+
+            results[f"slider_{name}"] = _metric(
+                256 / _median_time(slide, repeat), "events/s", "higher"
+            )
+        picker.alpha_slider_value.set(128)
+        picker.update_alpha()
+        picker.pick_from_screen().pick()
+        if picker.model.alpha != 128:
+            raise RuntimeError(
+                f"an eyedropper pick reset the alpha to {picker.model.alpha}"
+            )
+        close(picker)
+
+        picker = make(CTkColorPicker, widths[0])
+        scaling = picker._get_widget_scaling()
+
+        def rescale() -> None:
+            for factor in (1.5, 1.0) * 5:
+                picker._set_scaling(scaling * factor, picker._get_window_scaling())
+                picker.update_idletasks()
+
+        rescale()
+        results["rescale_warm"] = _metric(_median_time(rescale, repeat) / 10, "s")
+        close(picker)
+
+        picker = CTkColorPicker(root, width=widths[0], resizable=True)
+        picker.pack(fill="both", expand=True)
+        picker.update_idletasks()
+        sizes = [picker.image_dimension + step for step in range(5, 105, 5)]
+
+        def preview() -> None:
+            for size in sizes:
+                picker._preview_resize(size, size)
+                root.update_idletasks()
+
+        def settle() -> None:
+            wheel_assets.clear_cache()
+            picker._fit_wheel(sizes[-1], sizes[-1])
+            picker._fit_wheel(sizes[0], sizes[0])
+            root.update_idletasks()
+
+        results["resize_preview"] = _metric(
+            _median_time(preview, repeat) / len(sizes), "s"
+        )
+        results["resize_settle_cold"] = _metric(_median_time(settle, repeat) / 2, "s")
+        close(picker)
+        for cls in (CTkColorPicker, AskColor):
+            label = cls.__name__
+            for width in widths:
+                prefix = f"{label}_{width}"
+
+                def cold() -> None:
+                    wheel_assets.clear_cache()
+                    picker_model.clear_placement_cache()
+                    close(make(cls, width))
+
+                results[f"{prefix}_construct_cold"] = _metric(
+                    _median_time(cold, repeat), "s"
+                )
+                results[f"{prefix}_construct_warm"] = _metric(
+                    _median_time(lambda: close(make(cls, width)), repeat), "s"
+                )
+                if cls is AskColor:
+                    dialog = AskColor(width=width, reusable=True)
+                    dialog.update_idletasks()
+
+                    def reopen() -> None:
+                        dialog._on_closing()
+                        dialog.set_initial_color("#33aa77")
+                        dialog._show()
+                        dialog.update_idletasks()
+
+                    results[f"{prefix}_reopen"] = _metric(
+                        _median_time(reopen, repeat), "s"
+                    )
+                    dialog.destroy()
+
+                widget = make(cls, width)
+                events = _drag_path(widget.image_dimension, DRAG_EVENTS)
+
+                def drag() -> None:
+                    for event in events:
+                        widget.on_mouse_drag(event)
+                    widget.update_idletasks()
+
+                results[f"{prefix}_drag"] = _metric(
+                    len(events) / _median_time(drag, repeat), "events/s", "higher"
+                )
+
+                colors = ["#ff8800", "#00aaff", "#3a7", "#123456", "#fedcba"]
+
+                def apply_hex() -> None:
+                    for color in colors:
+                        widget.entry.delete(0, "end")
+                        widget.entry.insert(0, color)
+                        widget.apply_hex_input()
+
+                results[f"{prefix}_apply_hex"] = _metric(
+                    _median_time(apply_hex, repeat) / len(colors), "s"
+                )
+                close(widget)
+
+                gc.collect()
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+                widgets = [make(cls, width) for _ in range(5)]
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                size = sum(s.size_diff for s in after.compare_to(before, "filename"))
+                results[f"{prefix}_memory"] = _metric(size / len(widgets), "B")
+                for widget in widgets:
+                    close(widget)
+    finally:
+        root.destroy()
+    return results
+
+
+def run(
+    widths: Sequence[int] = DEFAULT_WIDTHS, repeat: int = 5, widgets: bool = True
+) -> dict[str, Any]:
+    """Run every benchmark and return the report.
+
+    Parameters
+    ----------
+    widths : Sequence[int]
+        Picker widths to measure.
+    repeat : int
+        Repetitions per measurement; the median is reported.
+    widgets : bool
+        Run the benchmarks that need a display. They are skipped when no
+        display can be opened.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"meta": {...}, "results": {name: {"value", "unit", "better"}},
+        "skipped": {name: reason}}``.
+    """
+
+    from . import __version__, wheel_renderer
+
+    report: dict[str, Any] = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": wheel_renderer.HAS_NUMPY,
+            "widths": list(widths),
+            "repeat": repeat,
+        },
+        "results": {},
+        "skipped": {},
+    }
+    results = report["results"]
+    results.update(bench_imports(repeat))
+    results.update(bench_lookup(repeat))
+    results.update(bench_model(widths, repeat))
+    results.update(bench_batch(repeat))
+    results.update(bench_nearest(repeat))
+
+    if not widgets:
+        report["skipped"]["widgets"] = "disabled"
+        return report
+    xvfb = start_xvfb()
+    try:
+        results.update(bench_widgets(widths, repeat))
+    except Exception as error:  # no display, missing Tk, ...
+        report["skipped"]["widgets"] = f"{type(error).__name__}: {error}"
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    return report
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Return a description of every metric that regressed.
+
+    A metric regresses when it is more than ``threshold`` (relative) worse
+    than in ``baseline``, or when a lower-is-better metric that was zero is
+    no longer zero. A ``"thresholds"`` mapping in the baseline overrides the
+    threshold per metric. Metrics missing from either report are ignored.
+    """
+
+    overrides = baseline.get("thresholds", {})
+    regressions = []
+    for name, old in baseline.get("results", {}).items():
+        new = report["results"].get(name)
+        if new is None:
+            continue
+        limit = overrides.get(name, threshold)
+        higher = old.get("better", "lower") == "higher"
+        if not old["value"]:
+            if not higher and new["value"]:
+                regressions.append(
+                    f"{name}: {new['value']:.6g} {new['unit']} vs baseline 0"
+                )
+            continue
+        ratio = new["value"] / old["value"]
+        if higher:
+            regressed = ratio < 1 - limit
+        else:
+            regressed = ratio > 1 + limit
+        if regressed:
+            regressions.append(
+                f"{name}: {new['value']:.6g} {new['unit']} vs baseline "
+                f"{old['value']:.6g} ({ratio:.2f}x, limit {limit:.0%})"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m CTkColorPicker.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--widths", type=int, nargs="+", default=list(DEFAULT_WIDTHS), metavar="PX"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--no-widgets", action="store_true", help="skip benchmarks that need Tk"
+    )
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed relative regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.widths, max(1, args.repeat), not args.no_widgets)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
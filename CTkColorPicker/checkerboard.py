@@ -0,0 +1,113 @@
+"""Previews of translucent colors composited over a checkerboard.
+
+A checkerboard holds only two colors, so a translucent color over it also
+holds only two: the tile is built once per size as a two-entry palette image
+and a preview only swaps its palette for the two composited colors. Previews
+are kept in a small LRU cache, so dragging the alpha slider back and forth
+reuses them.
+"""
+
+import functools
+
+from PIL import Image
+
+from .lru import CacheInfo, LRUCache
+
+CHECKER_CELL = 6
+"""Side length in pixels of one checkerboard square."""
+
+CHECKER_COLORS = ((255, 255, 255), (204, 204, 204))
+"""Light and dark squares of the checkerboard."""
+
+SWATCH_HEIGHT = 16
+"""Height in pixels, before scaling, of the preview shown by pickers created
+``with_alpha``."""
+
+DEFAULT_PREVIEW_CACHE_SIZE = 64
+"""Number of composited previews kept."""
+
+
+_previews = LRUCache(DEFAULT_PREVIEW_CACHE_SIZE)
+
+
+@functools.lru_cache(maxsize=16)
+def checkerboard_tile(size: tuple[int, int], cell: int = CHECKER_CELL) -> Image.Image:
+    """Return a ``"P"`` image of palette indices ``0`` and ``1`` laid out as
+    a checkerboard of ``cell`` pixel squares.
+
+    The image is shared and must not be modified.
+    """
+
+    width, height = size
+    cell = max(1, int(cell))
+    even = bytes((x // cell) & 1 for x in range(width))
+    odd = bytes(1 - i for i in even)
+    rows = (odd if (y // cell) & 1 else even for y in range(height))
+    return Image.frombytes("P", size, b"".join(rows))
+
+
+def composite_rgb(
+    rgb: tuple[int, int, int], alpha: int, background: tuple[int, int, int]
+) -> tuple[int, int, int]:
+    """Return ``rgb`` at opacity ``alpha`` (0..255) over an opaque
+    ``background``."""
+
+    rest = 255 - alpha
+    return tuple((c * alpha + bg * rest + 127) // 255 for c, bg in zip(rgb, background))
+
+
+def checkerboard_preview(
+    size: tuple[int, int],
+    rgb: tuple[int, int, int],
+    alpha: int,
+    cell: int = CHECKER_CELL,
+) -> Image.Image:
+    """Return an RGB image of ``rgb`` at opacity ``alpha`` over the
+    checkerboard.
+
+    Parameters
+    ----------
+    size : tuple[int, int]
+        Width and height of the preview in pixels.
+    rgb : tuple[int, int, int]
+        Color to show.
+    alpha : int
+        Opacity of the color, 0..255.
+    cell : int
+        Side length of the checkerboard squares.
+
+    Returns
+    -------
+    Image.Image
+        The preview, shared through the cache and not to be modified.
+    """
+
+    key = (size, cell, rgb, alpha)
+    image = _previews.get(key)
+    if image is not None:
+        return image
+
+    image = checkerboard_tile(size, cell).copy()
+    light, dark = (composite_rgb(rgb, alpha, color) for color in CHECKER_COLORS)
+    image.putpalette(bytes(light + dark))
+    image = image.convert("RGB")
+    _previews.put(key, image)
+    return image
+
+
+def preview_cache_info() -> CacheInfo:
+    """Return hit, miss and eviction counters of the preview cache."""
+
+    return _previews.info()
+
+
+def set_preview_cache_size(maxsize: int) -> None:
+    """Change the number of previews kept, evicting the oldest if needed."""
+
+    _previews.resize(maxsize)
+
+
+def clear_preview_cache() -> None:
+    """Drop every cached preview and reset the statistics."""
+
+    _previews.clear()
@@ -0,0 +1,219 @@
+"""Vectorized versions of the scalar color conversions in :mod:`color_utils`.
+
+Every function takes a whole palette at once and returns packed NumPy
+arrays, producing exactly the values of the corresponding scalar function
+for each entry. Hex strings are validated in bulk: instead of raising or
+returning ``None`` per item, the parsers return a boolean validity mask.
+"""
+
+import string
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+_HEX_DIGITS = "0123456789abcdef"
+
+_HEX_TABLE = None
+if np is not None:
+    # Digit value of every ASCII code point, -1 for non-digits; index 128
+    # stands for all non-ASCII characters.
+    _HEX_TABLE = np.full(129, -1, dtype=np.int16)
+    for _char in string.hexdigits:
+        _HEX_TABLE[ord(_char)] = int(_char, 16)
+
+
+def _require_numpy(name: str) -> None:
+    """Raise :class:`ImportError` if NumPy is missing."""
+
+    if np is None:
+        raise ImportError(f"{name} requires NumPy")
+
+
+def _hex_values(values: Any) -> "np.ndarray":
+    """Return ``values`` as a flat unicode array.
+
+    ``bytes``-like buffers are split into one ASCII color per line.
+    """
+
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        values = bytes(values).splitlines()
+    array = np.asarray(values)
+    if array.dtype.kind != "U":
+        array = array.astype(np.str_)
+    return np.char.strip(array.reshape(-1))
+
+
+def parse_hex_batch(values: Any) -> tuple["np.ndarray", "np.ndarray"]:
+    """Parse many hex colors at once.
+
+    Parameters
+    ----------
+    values : Any
+        Sequence or NumPy array of strings, or a ``bytes``-like buffer
+        holding one color per line. Entries follow :func:`normalize_hex`:
+        surrounding whitespace, case and a leading ``#`` are ignored and
+        both ``rgb`` and ``rrggbb`` forms are accepted.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        ``(rgb, valid)``: an ``(n, 3)`` ``uint8`` array of colors, zero for
+        invalid entries, and an ``(n,)`` boolean mask of the entries for
+        which :func:`normalize_hex` would not return ``None``.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    _require_numpy("parse_hex_batch")
+    array = _hex_values(values)
+    count = array.shape[0]
+    width = array.dtype.itemsize // 4
+    codes = np.zeros((count, max(width, 7)), dtype=np.uint32)
+    if width:
+        codes[:, :width] = array.view(np.uint32).reshape(count, width)
+
+    digits = _HEX_TABLE[np.minimum(codes, 128)]
+
+    hashed = (codes[:, 0] == ord("#")).astype(np.intp)
+    length = np.char.str_len(array) - hashed
+    short = length == 3
+    offsets = np.where(short[:, np.newaxis], np.array([0, 0, 1, 1, 2, 2]), np.arange(6))
+    picked = np.take_along_axis(digits, hashed[:, np.newaxis] + offsets, axis=1)
+    valid = (short | (length == 6)) & (picked >= 0).all(axis=1)
+
+    rgb = (picked[:, 0::2] * 16 + picked[:, 1::2]).astype(np.uint8)
+    rgb[~valid] = 0
+    return rgb, valid
+
+
+def rgb_to_hex_batch(rgb: Any) -> "np.ndarray":
+    """Format an ``(n, 3)`` array of 0..255 colors as ``#rrggbb`` strings.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    _require_numpy("rgb_to_hex_batch")
+    rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3)
+    digits = np.frombuffer(_HEX_DIGITS.encode(), dtype=np.uint8)
+    chars = np.empty((rgb.shape[0], 7), dtype=np.uint8)
+    chars[:, 0] = ord("#")
+    chars[:, 1::2] = digits[rgb >> 4]
+    chars[:, 2::2] = digits[rgb & 15]
+    return chars.view("S7").reshape(-1).astype("U7")
+
+
+def normalize_hex_batch(values: Any) -> tuple["np.ndarray", "np.ndarray"]:
+    """Vectorized :func:`normalize_hex`.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        ``(normalized, valid)``: ``#rrggbb`` strings, empty for invalid
+        entries, and the validity mask.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    rgb, valid = parse_hex_batch(values)
+    normalized = rgb_to_hex_batch(rgb)
+    normalized[~valid] = ""
+    return normalized, valid
+
+
+def rgb_to_hsv_batch(rgb: Any) -> "np.ndarray":
+    """Vectorized :func:`rgb_to_hsv`.
+
+    Parameters
+    ----------
+    rgb : Any
+        ``(n, 3)`` array-like of 0..255 channels, or a ``bytes``-like buffer
+        of packed RGB triplets.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n, 3)`` ``float64`` array of hue, saturation and value in 0..1.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    _require_numpy("rgb_to_hsv_batch")
+    if isinstance(rgb, (bytes, bytearray, memoryview)):
+        rgb = np.frombuffer(rgb, dtype=np.uint8)
+    r, g, b = np.asarray(rgb).reshape(-1, 3).T / 255
+
+    # Same operations, in the same order, as colorsys.rgb_to_hsv.
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    grey = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = rangec / maxc
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = (h / 6.0) % 1.0
+
+    h[grey] = 0.0
+    s[grey] = 0.0
+    return np.stack((h, s, maxc), axis=-1)
+
+
+def _hsv_to_rgb_array(
+    h: "np.ndarray", s: "np.ndarray", v: "float | np.ndarray"
+) -> "np.ndarray":
+    """Vectorized :func:`colorsys.hsv_to_rgb` returning floats in 0..1."""
+
+    h6 = h * 6.0
+    i = h6.astype(np.int64)
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    vv = np.full_like(s, v)
+    i %= 6
+    r = np.choose(i, (vv, q, p, p, t, vv))
+    g = np.choose(i, (t, vv, vv, q, p, p))
+    b = np.choose(i, (p, p, t, vv, vv, q))
+    return np.stack((r, g, b), axis=-1)
+
+
+def hsv_to_rgb_batch(hsv: Any) -> "np.ndarray":
+    """Vectorized :func:`hsv_to_rgb`.
+
+    Parameters
+    ----------
+    hsv : Any
+        ``(n, 3)`` array-like of hue, saturation and value in 0..1.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n, 3)`` ``uint8`` array of colors.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    _require_numpy("hsv_to_rgb_batch")
+    hsv = np.asarray(hsv, dtype=np.float64).reshape(-1, 3)
+    rgb = _hsv_to_rgb_array(hsv[:, 0], hsv[:, 1], hsv[:, 2])
+    return np.rint(rgb * 255).astype(np.uint8)
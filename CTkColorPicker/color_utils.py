@@ -1,30 +1,69 @@
 import math
 import colorsys
-from typing import Callable
-from PIL import Image
+import functools
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 import string
 import bisect
 
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
 TAU = 2 * math.pi
 """Full circle constant ``2π`` used for angle calculations."""
 
 HUE_OFFSET = 0
 """Legacy hue offset (no longer applied)."""
 
+_MISSING = object()
+_applied_options: "weakref.WeakKeyDictionary[Any, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_tk_calls_issued = 0
+_tk_calls_skipped = 0
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Import NumPy on first use; return ``None`` if it is not installed.
+
+    NumPy and Pillow are only needed by the lookup builders, so importing
+    this module for the color helpers stays cheap.
+    """
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - NumPy is optional
+        return None
+    return numpy
+
+
+class TkCallStats(NamedTuple):
+    """Widget write calls issued and skipped by :func:`configure_changed`."""
+
+    issued: int
+    skipped: int
+
 
-def normalize_hex(value: str | None) -> str | None:
-    """Return a normalized ``#rrggbb`` color string or ``None`` if invalid."""
+def normalize_hex(value: str | None, allow_alpha: bool = False) -> str | None:
+    """Return a normalized ``#rrggbb`` color string or ``None`` if invalid.
+
+    With ``allow_alpha`` the 4 and 8 digit forms ``#rgba`` and ``#rrggbbaa``
+    are accepted too and normalized to ``#rrggbbaa``; colors given without
+    alpha stay ``#rrggbb``.
+    """
 
     if value is None:
         return None
     value = value.strip().lower()
-    if not value:
-        return None
     if value.startswith("#"):
         value = value[1:]
-    if len(value) == 3 and all(c in string.hexdigits for c in value):
-        return "#" + "".join(c * 2 for c in value)
-    if len(value) == 6 and all(c in string.hexdigits for c in value):
+    if not value or not all(c in string.hexdigits for c in value):
+        return None
+    if len(value) in (3, 4):
+        value = "".join(c * 2 for c in value)
+    if len(value) == 6 or (allow_alpha and len(value) == 8):
         return "#" + value
     return None
 
@@ -42,6 +81,13 @@ def hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
     return int(round(r * 255)), int(round(g * 255)), int(round(b * 255))
 
 
+def readable_text_color(r: int, g: int, b: int) -> str:
+    """Return ``"white"`` or ``"black"``, whichever reads better on the color."""
+
+    luminance = 0.299 * r + 0.587 * g + 0.114 * b
+    return "white" if luminance < 70 else "black"
+
+
 def projection_on_circle(
     point_x: float, point_y: float, circle_x: float, circle_y: float, radius: float
 ) -> tuple[float, float]:
@@ -52,8 +98,88 @@ def projection_on_circle(
     return projection_x, projection_y
 
 
+def configure_changed(widget: Any, **options: Any) -> None:
+    """Configure ``widget`` with only the options whose value changed.
+
+    The last value applied through this function is remembered per widget,
+    so options must not be changed behind its back. All changed options are
+    sent in a single ``configure`` call.
+    """
+    global _tk_calls_issued, _tk_calls_skipped
+
+    try:
+        applied = _applied_options.setdefault(widget, {})
+    except TypeError:
+        applied = {}
+    changed = {
+        name: value
+        for name, value in options.items()
+        if applied.get(name, _MISSING) != value
+    }
+    if not changed:
+        _tk_calls_skipped += 1
+        return
+    widget.configure(**changed)
+    applied.update(changed)
+    _tk_calls_issued += 1
+
+
+def set_entry_text(entry: Any, text: str) -> None:
+    """Replace the text of ``entry`` unless it already shows ``text``."""
+    global _tk_calls_issued, _tk_calls_skipped
+
+    if entry.get() == text:
+        _tk_calls_skipped += 2
+        return
+    entry.delete(0, "end")
+    entry.insert(0, text)
+    _tk_calls_issued += 2
+
+
+def tk_call_stats() -> TkCallStats:
+    """Return how many widget write calls were issued and skipped."""
+
+    return TkCallStats(_tk_calls_issued, _tk_calls_skipped)
+
+
+def reset_tk_call_stats() -> None:
+    """Reset the counters returned by :func:`tk_call_stats`."""
+    global _tk_calls_issued, _tk_calls_skipped
+
+    _tk_calls_issued = _tk_calls_skipped = 0
+
+
+def wheel_hue_sat(
+    width: int,
+    height: int,
+    x: float,
+    y: float,
+    angle_lookup: tuple[list[float], list[float]] | None = None,
+) -> tuple[float, float]:
+    """Return the hue and saturation (0..1) at ``x``/``y`` on a wheel image.
+
+    The hue follows the angle counter-clockwise from the positive x axis,
+    mapped through ``angle_lookup`` when given, and the saturation is the
+    distance from the center relative to the rim, clamped to 1.
+    """
+
+    cx, cy = width / 2, height / 2
+    dx = x - cx
+    dy = cy - y  # invert y-axis for cartesian coordinates
+
+    angle = math.atan2(dy, dx) % TAU
+    if angle_lookup is not None:
+        h_val = angle_to_hue(angle, angle_lookup)
+    else:
+        h_val = (angle % TAU) / TAU
+
+    radius = math.sqrt(dx * dx + dy * dy)
+    max_radius = min(cx, cy) - 1
+    return h_val, min(radius / max_radius, 1.0)
+
+
 def update_colors(
-    image: Image.Image,
+    image: "Image.Image",
     target_x: int,
     target_y: int,
     brightness: int,
@@ -68,47 +194,27 @@ def update_colors(
     The color is derived from ``target_x``/``target_y`` relative to the wheel
     center. Hue and saturation are computed geometrically and combined with the
     provided ``brightness`` value to form the final RGB color using
-    :func:`colorsys.hsv_to_rgb`.
+    :func:`colorsys.hsv_to_rgb`. Widget options that already hold the new
+    values are not reconfigured.
     """
 
-    w, h = image.size
-    cx, cy = w / 2, h / 2
-    dx = target_x - cx
-    dy = cy - target_y  # invert y-axis for cartesian coordinates
-
-    angle = math.atan2(dy, dx) % TAU
-    if angle_lookup is not None:
-        h_val = angle_to_hue(angle, angle_lookup)
-    else:
-        h_val = (angle % TAU) / TAU
-
-    radius = math.sqrt(dx * dx + dy * dy)
-    max_radius = min(cx, cy) - 1
-    s_val = min(radius / max_radius, 1.0)
-    v_val = brightness / 255
-
-    r_f, g_f, b_f = colorsys.hsv_to_rgb(h_val, s_val, v_val)
-    rgb_color = [int(round(r_f * 255)), int(round(g_f * 255)), int(round(b_f * 255))]
+    h_val, s_val = wheel_hue_sat(*image.size, target_x, target_y, angle_lookup)
+    rgb_color = list(hsv_to_rgb(h_val, s_val, brightness / 255))
     hex_color = "#{:02x}{:02x}{:02x}".format(*rgb_color)
 
-    slider.configure(progress_color=hex_color)
+    configure_changed(slider, progress_color=hex_color)
 
+    text_color = "white" if brightness < 70 else "black"
     if hasattr(widget, "delete"):
-        widget.configure(fg_color=hex_color)
-        widget.delete(0, "end")
-        widget.insert(0, hex_color)
+        set_entry_text(widget, hex_color)
+        configure_changed(widget, fg_color=hex_color, text_color=text_color)
     else:
         try:
-            widget.configure(fg_color=hex_color, text=str(hex_color))
+            configure_changed(
+                widget, fg_color=hex_color, text=str(hex_color), text_color=text_color
+            )
         except Exception:
-            widget.configure(fg_color=hex_color)
-
-    if brightness < 70:
-        widget.configure(text_color="white")
-    else:
-        widget.configure(text_color="black")
-    if str(widget._fg_color) == "black":
-        widget.configure(text_color="white")
+            configure_changed(widget, fg_color=hex_color, text_color=text_color)
 
     if command and get_callback:
         command(get_callback())
@@ -117,7 +223,7 @@ def update_colors(
 
 
 def build_hue_to_angle_lookup(
-    image: Image.Image, samples: int = 1024, ring: float = 0.985
+    image: "Image.Image", samples: int = 1024, ring: float = 0.985
 ) -> tuple[list[float], list[float]]:
     """
     Build a hue→angle lookup from the *resized* wheel.
@@ -125,7 +231,19 @@ def build_hue_to_angle_lookup(
     - Samples a ring near the outer hue band (ring≈0.985).
     - Unwraps hue across the 1→0 discontinuity so the sequence is strictly increasing.
     - Rotates and normalizes back to 0..1 for clean interpolation.
+
+    Uses NumPy to sample and unwrap the whole ring at once when it is
+    installed, and a pure Python loop otherwise. Both return the same values.
     """
+    if _numpy() is not None:
+        return _build_hue_to_angle_lookup_numpy(image, samples, ring)
+    return _build_hue_to_angle_lookup_python(image, samples, ring)
+
+
+def _build_hue_to_angle_lookup_python(
+    image: "Image.Image", samples: int, ring: float
+) -> tuple[list[float], list[float]]:
+    """Pure Python implementation of :func:`build_hue_to_angle_lookup`."""
     w, h = image.size
     cx, cy = w / 2, h / 2
     R = min(cx, cy) - 1
@@ -172,8 +290,67 @@ def build_hue_to_angle_lookup(
     return hues_norm, angles
 
 
-def hue_to_angle(h: float, lookup: tuple[list[float], list[float]]) -> float:
-    """Interpolate wheel angle (0..TAU) for HSV hue h (0..1) using the lookup."""
+def _build_hue_to_angle_lookup_numpy(
+    image: "Image.Image", samples: int, ring: float
+) -> tuple[list[float], list[float]]:
+    """NumPy implementation of :func:`build_hue_to_angle_lookup`."""
+    np = _numpy()
+    w, h = image.size
+    cx, cy = w / 2, h / 2
+    r_sample = (min(cx, cy) - 1) * ring
+
+    angles = (np.arange(samples) / samples) * TAU
+    xs = np.rint(cx + r_sample * np.cos(angles)).astype(np.intp)
+    ys = np.rint(cy - r_sample * np.sin(angles)).astype(np.intp)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+    rgb = np.asarray(image)[ys, xs, :3].astype(np.float64) / 255
+    raw_hues = _rgb_to_hue_array(rgb[:, 0], rgb[:, 1], rgb[:, 2])
+
+    # Unwrap with a running turn count, then clamp noise to monotonic.
+    turns = np.concatenate(([0.0], np.cumsum(np.diff(raw_hues) < -0.5)))
+    unwrapped = np.maximum.accumulate(raw_hues + turns)
+
+    start = unwrapped[0]
+    span = unwrapped[-1] - start
+    if span <= 0:
+        hues_norm = np.arange(samples) / (samples - 1)
+    else:
+        hues_norm = (unwrapped - start) / span
+
+    return hues_norm.tolist(), angles.tolist()
+
+
+def _rgb_to_hue_array(
+    r: "np.ndarray", g: "np.ndarray", b: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized hue component of :func:`colorsys.rgb_to_hsv`."""
+    np = _numpy()
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    gray = rangec == 0
+    rangec = np.where(gray, 1.0, rangec)
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    hue = np.where(
+        r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc)
+    )
+    hue = (hue / 6.0) % 1.0
+    return np.where(gray, 0.0, hue)
+
+
+def hue_to_angle(
+    h: float, lookup: tuple[list[float], list[float]] | None = None
+) -> float:
+    """Interpolate wheel angle (0..TAU) for HSV hue h (0..1) using the lookup.
+
+    Without a lookup the wheel is assumed to be procedural, where the mapping
+    is exactly ``angle = h * TAU``.
+    """
+    if lookup is None:
+        return (h * TAU) % TAU
     hues, angles = lookup
     i = bisect.bisect_left(hues, h)
     if i <= 0:
@@ -188,10 +365,18 @@ def hue_to_angle(h: float, lookup: tuple[list[float], list[float]]) -> float:
     return t0 + (t1 - t0) * ((h - h0) / (h1 - h0))
 
 
-def angle_to_hue(angle: float, lookup: tuple[list[float], list[float]]) -> float:
-    """Interpolate HSV hue (0..1) for wheel angle a (0..TAU) using the lookup."""
-    hues, angles = lookup
+def angle_to_hue(
+    angle: float, lookup: tuple[list[float], list[float]] | None = None
+) -> float:
+    """Interpolate HSV hue (0..1) for wheel angle a (0..TAU) using the lookup.
+
+    Without a lookup the wheel is assumed to be procedural, where the mapping
+    is exactly ``h = angle / TAU``.
+    """
     a = angle % TAU
+    if lookup is None:
+        return a / TAU
+    hues, angles = lookup
     i = bisect.bisect_left(angles, a)
     if i <= 0:
         return hues[0]
@@ -5,23 +5,23 @@
 import tkinter
 import customtkinter
 from PIL import Image, ImageTk
-import os
-import math
-import colorsys
-from typing import Any
-from .color_utils import (
-    projection_on_circle,
-    update_colors as utils_update_colors,
-    normalize_hex,
-    build_hue_to_angle_lookup,
-    hue_to_angle,
-    TAU,
+from typing import Any, Mapping
+from .checkerboard import SWATCH_HEIGHT
+from .color_utils import configure_changed, set_entry_text
+from .instrumentation import stopwatch
+from .nearest_color import NearestColorIndex, nearest_color_index
+from .picker_model import PickerModel
+from .picker_view import TARGET_SIZE, WheelViewMixin
+from .scheduling import (
+    DEFAULT_MAX_UPDATE_RATE,
+    DEFAULT_RESIZE_DELAY,
+    Debouncer,
+    LatestWinsScheduler,
 )
+from .wheel_assets import MIN_WHEEL_SIZE, get_wheel_assets
 
-PATH = os.path.dirname(os.path.realpath(__file__))
 
-
-class AskColor(customtkinter.CTkToplevel):
+class AskColor(WheelViewMixin, customtkinter.CTkToplevel):
     """Toplevel dialog for selecting a color via a wheel and slider."""
 
     def __init__(
@@ -36,6 +36,13 @@ class AskColor(customtkinter.CTkToplevel):
         text: str = "OK",
         corner_radius: int = 24,
         slider_border: int = 1,
+        max_update_rate: float | None = DEFAULT_MAX_UPDATE_RATE,
+        shade_wheel: bool = True,
+        reusable: bool = False,
+        nearest_colors: NearestColorIndex | Mapping[str, str] | bool | None = None,
+        color_space: str = "hsv",
+        with_alpha: bool = False,
+        resizable: bool = False,
         **button_kwargs: Any,
     ) -> None:
         """Initialize the color picker dialog.
@@ -63,22 +70,55 @@ class AskColor(customtkinter.CTkToplevel):
             Corner radius applied to widgets.
         slider_border : int
             Border width for the brightness slider.
+        max_update_rate : float | None
+            Maximum number of color updates per second while dragging the
+            wheel or the slider. ``None`` updates on every event.
+        shade_wheel : bool
+            Darken the wheel to match the brightness slider.
+        reusable : bool
+            Hide the dialog instead of destroying it when it is closed, so it
+            can be shown again with :meth:`ask` without being rebuilt.
+        nearest_colors : NearestColorIndex | Mapping[str, str] | bool | None
+            Show the name of the closest palette color under the entry:
+            ``True`` for the CSS named colors, or a mapping of names to hex
+            colors or a prebuilt :class:`NearestColorIndex`.
+        color_space : str
+            ``"hsv"`` for the classic wheel or ``"oklch"`` for a perceptual
+            wheel of OKLCH hue and relative chroma whose slider sets the
+            lightness. The OKLCH wheel needs NumPy.
+        with_alpha : bool
+            Add an opacity slider and a checkerboard preview; colors are
+            then returned and accepted as ``#rrggbbaa``.
+        resizable : bool
+            Let the user resize the dialog; the wheel grows and shrinks
+            with it.
         **button_kwargs : Any
             Additional keyword arguments forwarded to the confirmation
             button.
         """
 
+        watch = stopwatch("construct")
         super().__init__()
 
         self.title(title)
         WIDTH = width if width >= 200 else 200
+        self._picker_width = WIDTH
+        self._nearest = nearest_color_index(nearest_colors)
         HEIGHT = WIDTH + 150
-        self.image_dimension = self._apply_window_scaling(WIDTH - 100)
-        self.target_dimension = self._apply_window_scaling(20)
-
-        self.maxsize(WIDTH, HEIGHT)
-        self.minsize(WIDTH, HEIGHT)
-        self.resizable(width=False, height=False)
+        if self._nearest is not None:
+            HEIGHT += 30
+        if with_alpha:
+            HEIGHT += 60
+        self.image_dimension = self._scaled(WIDTH - 100)
+        self.target_dimension = self._scaled(TARGET_SIZE)
+
+        if resizable:
+            self.geometry(f"{WIDTH}x{HEIGHT}")
+            self.minsize(200, HEIGHT - WIDTH + 200)
+        else:
+            self.maxsize(WIDTH, HEIGHT)
+            self.minsize(WIDTH, HEIGHT)
+            self.resizable(width=False, height=False)
         self.transient(self.master)
         self.lift()
         self.grid_columnconfigure(0, weight=1)
@@ -89,6 +129,9 @@ class AskColor(customtkinter.CTkToplevel):
         self.default_hex_color = "#ffffff"
         self.default_rgb = [255, 255, 255]
         self.rgb_color = self.default_rgb[:]
+        self._reusable = reusable
+        self._waiting = False
+        self._closed = tkinter.BooleanVar(master=self)
 
         self.bg_color = (
             self._apply_appearance_mode(
@@ -136,30 +179,69 @@ class AskColor(customtkinter.CTkToplevel):
             highlightthickness=0,
             bg=self.fg_color,
         )
-        self.canvas.pack(pady=20)
-        self.canvas.bind("<Button-1>", self.on_mouse_drag)
-        self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
-
-        with Image.open(os.path.join(PATH, "color_wheel.png")) as img:
-            self.img1 = img.resize(
-                (self.image_dimension, self.image_dimension),
-                Image.Resampling.LANCZOS,
-            )
-            self.wheel = ImageTk.PhotoImage(self.img1)
-
-        # Build hue angle map
-        self._hue_lookup = build_hue_to_angle_lookup(self.img1)
-
-        with Image.open(os.path.join(PATH, "target.png")) as img:
-            self.img2 = img.resize(
-                (self.target_dimension, self.target_dimension),
-                Image.Resampling.LANCZOS,
-            )
-            self.target = ImageTk.PhotoImage(self.img2)
-
-        self.canvas.create_image(
+        if resizable:
+            # Request only the smallest wheel, so the canvas rather than
+            # the widgets packed after it gives way when space shrinks.
+            minimum = self._scaled(MIN_WHEEL_SIZE)
+            self.canvas.configure(width=minimum, height=minimum)
+            self.canvas.pack(pady=20, fill="both", expand=True)
+        else:
+            self.canvas.pack(pady=20)
+        self._drag_scheduler = LatestWinsScheduler(
+            self, self.on_mouse_drag, max_update_rate
+        )
+        self._slider_scheduler = LatestWinsScheduler(
+            self, self.update_colors, max_update_rate
+        )
+        self._alpha_scheduler = LatestWinsScheduler(
+            self, self.update_alpha, max_update_rate
+        )
+        self._resizable = resizable
+        self._laid_out = False
+        self._origin_x = self._origin_y = 0
+        self._preview_source: Image.Image | None = None
+        self._preview_photo: ImageTk.PhotoImage | None = None
+        self._preview_item: int | None = None
+        self._resize_scheduler = LatestWinsScheduler(
+            self, self._preview_resize, max_update_rate
+        )
+        self._resize_debouncer = Debouncer(self, self._fit_wheel, DEFAULT_RESIZE_DELAY)
+        if resizable:
+            self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.canvas.bind("<Button-1>", self._on_mouse_press)
+        self.canvas.bind("<B1-Motion>", self._drag_scheduler.submit)
+        self.canvas.bind("<ButtonRelease-1>", self._on_mouse_release)
+
+        assets = get_wheel_assets(
+            self,
+            self.image_dimension,
+            self.target_dimension,
+            self._scaling(),
+            color_space=color_space,
+        )
+        watch.lap("assets")
+        self._assets = assets
+        self.model = PickerModel(
+            self.image_dimension,
+            assets.hue_lookup,
+            assets.index,
+            color_space=color_space,
+            with_alpha=with_alpha,
+        )
+        self._shade_wheel = shade_wheel
+        self._shaded_wheel: ImageTk.PhotoImage | None = None
+        self._wheel_brightness = assets.base_brightness
+        self.img1 = assets.wheel_image
+        self.wheel = assets.wheel
+        self.img2 = assets.target_image
+        self.target = assets.target
+
+        self._wheel_item = self.canvas.create_image(
             self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
         )
+        self._target_item = self.canvas.create_image(
+            self.image_dimension / 2, self.image_dimension / 2, image=self.target
+        )
         self.brightness_slider_value = customtkinter.IntVar()
         self.brightness_slider_value.set(255)
 
@@ -177,10 +259,58 @@ class AskColor(customtkinter.CTkToplevel):
             corner_radius=self.corner_radius,
             button_color=self.button_color,
             button_hover_color=self.button_hover_color,
-            command=lambda x: self.update_colors(),
+            command=lambda x: self._slider_scheduler.submit(),
         )
+        self.slider.bind("<ButtonRelease-1>", lambda e: self._slider_scheduler.flush())
         self.slider.pack(fill="both", pady=(0, 15), padx=20 - self.slider_border)
 
+        self.alpha_slider: customtkinter.CTkSlider | None = None
+        self.swatch: tkinter.Canvas | None = None
+        self._swatch_image: ImageTk.PhotoImage | None = None
+        self._swatch_color: tuple | None = None
+        if with_alpha:
+            self.alpha_slider_value = customtkinter.IntVar(value=255)
+            self.alpha_slider = customtkinter.CTkSlider(
+                master=self.frame,
+                height=20,
+                border_width=self.slider_border,
+                button_length=15,
+                from_=0,
+                to=255,
+                variable=self.alpha_slider_value,
+                number_of_steps=256,
+                button_corner_radius=self.corner_radius,
+                corner_radius=self.corner_radius,
+                button_color=self.button_color,
+                button_hover_color=self.button_hover_color,
+                command=lambda x: self._alpha_scheduler.submit(),
+            )
+            self.alpha_slider.bind(
+                "<ButtonRelease-1>", lambda e: self._alpha_scheduler.flush()
+            )
+            self.alpha_slider.pack(
+                fill="both", pady=(0, 15), padx=20 - self.slider_border
+            )
+            self._swatch_size = (
+                self.image_dimension,
+                self._scaled(SWATCH_HEIGHT),
+            )
+            self.swatch = tkinter.Canvas(
+                self.frame,
+                width=self._swatch_size[0],
+                height=self._swatch_size[1],
+                highlightthickness=0,
+                bg=self.fg_color,
+            )
+            self._swatch_image = ImageTk.PhotoImage(
+                "RGB", self._swatch_size, master=self
+            )
+            self._swatch_item = self.swatch.create_image(
+                0, 0, anchor="nw", image=self._swatch_image
+            )
+            self._update_swatch()
+            self.swatch.pack(pady=(0, 10))
+
         self.entry = customtkinter.CTkEntry(
             master=self.frame,
             text_color="#000000",
@@ -189,12 +319,18 @@ class AskColor(customtkinter.CTkToplevel):
             corner_radius=self.corner_radius,
             justify="center",
         )
-        self.entry.insert(0, self.default_hex_color)
+        self.entry.insert(0, self._with_alpha(self.default_hex_color))
         self.entry.bind("<FocusOut>", self.apply_hex_input)
         self.entry.bind("<Return>", self.apply_hex_input)
         self.entry.pack(fill="both", padx=10)
 
+        self.nearest_label: customtkinter.CTkLabel | None = None
+        if self._nearest is not None:
+            self.nearest_label = customtkinter.CTkLabel(master=self.frame, text="")
+            self.nearest_label.pack(fill="x", padx=10, pady=(5, 0))
+
         self.set_initial_color(initial_color)
+        watch.lap("initial_color")
 
         self.button = customtkinter.CTkButton(
             master=self.frame,
@@ -207,6 +343,7 @@ class AskColor(customtkinter.CTkToplevel):
             **button_kwargs,
         )
         self.button.pack(fill="both", padx=10, pady=20)
+        watch.stop("widgets")
 
         self.after(150, lambda: self.entry.focus())
 
@@ -221,42 +358,120 @@ class AskColor(customtkinter.CTkToplevel):
         Returns
         -------
         str | None
-            Hexadecimal color string or ``None`` if the dialog was closed
-            without selection.
+            Hexadecimal color string, ``#rrggbbaa`` if the dialog was created
+            ``with_alpha``, or ``None`` if the dialog was closed without
+            selection.
         """
 
-        self._color = self.default_hex_color
-        self.master.wait_window(self)
+        self._color = self._with_alpha(self.default_hex_color)
+        if not self._reusable:
+            self.master.wait_window(self)
+            return self._color
+
+        if self.state() == "withdrawn":
+            self._show()
+        self._waiting = True
+        try:
+            self.wait_variable(self._closed)
+        finally:
+            self._waiting = False
         return self._color
 
-    def _ok_event(self, event: tkinter.Event | None = None) -> None:
-        """Confirm the selection and close the dialog.
+    def ask(self, initial_color: str | None = None) -> str | None:
+        """Show a ``reusable`` dialog again and return the selected color.
 
         Parameters
         ----------
-        event : tkinter.Event | None
-            Optional event object from button or keyboard interaction.
+        initial_color : str | None
+            Color to start from. ``None`` keeps the last selection.
+
+        Returns
+        -------
+        str | None
+            Hexadecimal color string or ``None`` if the dialog was closed
+            without selection.
         """
 
-        self.apply_hex_input()
-        self._color = self.default_hex_color
+        if initial_color is not None:
+            self.set_initial_color(initial_color)
+        self._show()
+        return self.get()
+
+    def _show(self) -> None:
+        """Bring a hidden reusable dialog back and make it modal again."""
+
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.after(150, lambda: self.entry.focus())
+
+    def destroy(self) -> None:
+        """Destroy the dialog, releasing a :meth:`get` that is still waiting."""
+
+        waiting = self._waiting
+        super().destroy()
+        if waiting:
+            self._color = None
+            self._closed.set(True)
+
+    def _close(self) -> None:
+        """Hide a reusable dialog, destroy any other one.
+
+        A pending resize is finished before a reusable dialog is hidden and
+        dropped before any other one is destroyed, so no ``_fit_wheel``
+        runs afterwards.
+        """
+
+        self._resize_scheduler.cancel()
         self.grab_release()
+        if self._reusable:
+            self._resize_debouncer.flush()
+            self.withdraw()
+            self._closed.set(True)
+            return
+        self._resize_debouncer.cancel()
         self.destroy()
         del self.img1
         del self.img2
         del self.wheel
         del self.target
 
+    def _ok_event(self, event: tkinter.Event | None = None) -> None:
+        """Confirm the selection and close the dialog.
+
+        Parameters
+        ----------
+        event : tkinter.Event | None
+            Optional event object from button or keyboard interaction.
+        """
+
+        self._drag_scheduler.flush()
+        self._slider_scheduler.flush()
+        self._alpha_scheduler.flush()
+        self.apply_hex_input()
+        self._color = self._with_alpha(self.default_hex_color)
+        self._close()
+
     def _on_closing(self) -> None:
         """Handle the window close event by discarding the selection."""
 
+        self._drag_scheduler.cancel()
+        self._slider_scheduler.cancel()
+        self._alpha_scheduler.cancel()
         self._color = None
-        self.grab_release()
-        self.destroy()
-        del self.img1
-        del self.img2
-        del self.wheel
-        del self.target
+        self._close()
+
+    def _on_mouse_press(self, event: tkinter.Event) -> None:
+        """Apply a click immediately, discarding older queued motion."""
+
+        self._resize_debouncer.flush()
+        self._drag_scheduler.cancel()
+        self.on_mouse_drag(event)
+
+    def _on_mouse_release(self, event: tkinter.Event) -> None:
+        """Apply the latest queued drag position when the button is released."""
+
+        self._drag_scheduler.flush()
 
     def on_mouse_drag(self, event: tkinter.Event) -> None:
         """Move the target when the user clicks or drags the mouse.
@@ -267,95 +482,57 @@ class AskColor(customtkinter.CTkToplevel):
             Event containing the mouse coordinates.
         """
 
-        x = event.x
-        y = event.y
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
+        watch = stopwatch("drag")
+        self.model.move_to(event.x - self._origin_x, event.y - self._origin_y)
+        watch.lap("model")
+        self._move_target()
+        self._show_color()
+        watch.stop("render")
 
-        d_from_center = math.sqrt(
-            ((self.image_dimension / 2) - x) ** 2
-            + ((self.image_dimension / 2) - y) ** 2
-        )
+    def _scaled(self, value: float) -> int:
+        """Return ``value`` in pixels at the window scaling."""
 
-        if d_from_center < self.image_dimension / 2:
-            self.target_x, self.target_y = x, y
-        else:
-            self.target_x, self.target_y = projection_on_circle(
-                x,
-                y,
-                self.image_dimension / 2,
-                self.image_dimension / 2,
-                self.image_dimension / 2 - 1,
-            )
+        return self._apply_window_scaling(value)
 
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
+    def _scaling(self) -> float:
+        """Return the window scaling the wheel is rasterized at."""
 
-        self.update_colors()
+        return self._get_window_scaling()
 
     def update_colors(self) -> None:
         """Update widget colors based on the current selection and brightness."""
 
-        brightness = self.brightness_slider_value.get()
-        self.rgb_color, self.default_hex_color = utils_update_colors(
-            self.img1,
-            getattr(self, "target_x", 0),
-            getattr(self, "target_y", 0),
-            brightness,
-            self.slider,
-            self.entry,
-            angle_lookup=self._hue_lookup,
-        )
+        watch = stopwatch("slider")
+        self.model.set_brightness(self.brightness_slider_value.get())
+        watch.lap("model")
+        self._update_wheel_shade()
+        watch.lap("shade")
+        self._show_color()
+        watch.stop("render")
+
+    def update_alpha(self) -> None:
+        """Update the entry and swatch after the alpha slider moved."""
+
+        watch = stopwatch("alpha")
+        self.model.set_alpha(self.alpha_slider_value.get())
+        watch.lap("model")
+        self._show_color()
+        watch.stop("render")
 
     def apply_hex_input(self, event: tkinter.Event | None = None) -> None:
         """Validate and apply the hex color entered by the user."""
 
-        value = self.entry.get().strip()
-        normalized = normalize_hex(value)
-        if normalized is None:
-            self.entry.delete(0, "end")
-            self.entry.insert(0, self.default_hex_color)
-            self.entry.configure(fg_color=self.default_hex_color)
-            self.slider.configure(progress_color=self.default_hex_color)
+        if not self.model.set_hex(self.entry.get().strip()):
+            set_entry_text(self.entry, self._with_alpha(self.default_hex_color))
+            configure_changed(self.entry, fg_color=self.default_hex_color)
+            configure_changed(self.slider, progress_color=self.default_hex_color)
+            self.model.brightness = 255
             self.brightness_slider_value.set(255)
+            self._update_wheel_shade()
             self.entry.focus()
             return
 
-        r, g, b = tuple(int(normalized[i : i + 2], 16) for i in (1, 3, 5))
-        h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-        value = int(v * 255)
-        self.brightness_slider_value.set(value)
-
-        try:
-            angle = hue_to_angle(h, self._hue_lookup)
-        except Exception:
-            angle = (h * TAU) % TAU  # safety fallback
-
-        radius = s * (self.image_dimension / 2 - 1)
-        self.target_x = self.image_dimension / 2 + radius * math.cos(angle)
-        self.target_y = self.image_dimension / 2 - radius * math.sin(angle)
-
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
-
-        self.default_hex_color = normalized
-        rgb = [r, g, b]
-        self.rgb_color = rgb[:]
-        self.default_rgb = rgb[:]
-        self.entry.delete(0, "end")
-        self.entry.insert(0, normalized)
-        self.entry.configure(fg_color=normalized)
-        self.slider.configure(progress_color=normalized)
-
-        brightness = 0.299 * r + 0.587 * g + 0.114 * b
-        if brightness < 70 or normalized == "#000000":
-            self.entry.configure(text_color="white")
-        else:
-            self.entry.configure(text_color="black")
+        self._show_model()
 
     def set_initial_color(self, initial_color: str | None) -> None:
         """Position the target and widgets according to ``initial_color``.
@@ -366,50 +543,9 @@ class AskColor(customtkinter.CTkToplevel):
             Hexadecimal color string used to initialize the target position.
         """
 
-        normalized = normalize_hex(initial_color) if initial_color else None
-        if normalized is not None:
-            r, g, b = tuple(int(normalized[i : i + 2], 16) for i in (1, 3, 5))
-            h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-
-            value = int(v * 255)
-            self.brightness_slider_value.set(value)
-
-            try:
-                angle = hue_to_angle(h, self._hue_lookup)
-            except Exception:
-                angle = (h * TAU) % TAU  # safety fallback
-
-            radius = s * (self.image_dimension / 2 - 1)
-            self.target_x = self.image_dimension / 2 + radius * math.cos(angle)
-            self.target_y = self.image_dimension / 2 - radius * math.sin(angle)
-
-            self.canvas.delete("all")
-            self.canvas.create_image(
-                self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-            )
-            self.canvas.create_image(self.target_x, self.target_y, image=self.target)
-
-            self.default_hex_color = normalized
-            rgb = [r, g, b]
-            self.rgb_color = rgb[:]
-            self.default_rgb = rgb[:]
-
-            self.entry.delete(0, "end")
-            self.entry.insert(0, normalized)
-            self.entry.configure(fg_color=normalized)
-            self.slider.configure(progress_color=normalized)
-
-            brightness = 0.299 * r + 0.587 * g + 0.114 * b
-            if brightness < 70 or normalized == "#000000":
-                self.entry.configure(text_color="white")
-            else:
-                self.entry.configure(text_color="black")
+        if initial_color and self.model.set_hex(initial_color):
+            self._show_model()
             return
 
-        self.target_x = self.image_dimension / 2
-        self.target_y = self.image_dimension / 2
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
+        self.model.reset_position()
+        self._move_target()
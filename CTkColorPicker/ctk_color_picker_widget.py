@@ -1,27 +1,31 @@
 # CTk Color Picker widget for customtkinter
 # Author: Akash Bora (Akascape)
 
+import time
 import tkinter
 import customtkinter
 from PIL import Image, ImageTk
-import os
-import math
-import colorsys
-from typing import Any, Callable
-
-from .color_utils import (
-    projection_on_circle,
-    update_colors as utils_update_colors,
-    normalize_hex,
-    build_hue_to_angle_lookup,
-    hue_to_angle,
-    TAU,
+from concurrent.futures import Executor
+from typing import Any, Callable, Mapping
+
+from . import instrumentation
+from .checkerboard import SWATCH_HEIGHT
+from .color_utils import configure_changed, set_entry_text
+from .instrumentation import stopwatch
+from .nearest_color import NearestColorIndex, nearest_color_index
+from .picker_model import PickerModel
+from .picker_view import TARGET_SIZE, WheelViewMixin
+from .scheduling import (
+    DEFAULT_MAX_UPDATE_RATE,
+    DEFAULT_RESIZE_DELAY,
+    CallbackDispatcher,
+    Debouncer,
+    LatestWinsScheduler,
 )
+from .wheel_assets import MIN_WHEEL_SIZE, get_wheel_assets
 
-PATH = os.path.dirname(os.path.realpath(__file__))
 
-
-class CTkColorPicker(customtkinter.CTkFrame):
+class CTkColorPicker(WheelViewMixin, customtkinter.CTkFrame):
     """A color picker widget with a color wheel and brightness slider."""
 
     def __init__(
@@ -34,6 +38,17 @@ class CTkColorPicker(customtkinter.CTkFrame):
         corner_radius: int = 24,
         command: Callable[[str], None] | None = None,
         orientation: str = "vertical",
+        max_update_rate: float | None = DEFAULT_MAX_UPDATE_RATE,
+        shade_wheel: bool = True,
+        callback_mode: str = "change",
+        callback_rate: float = 30,
+        callback_delay: int = 150,
+        callback_executor: Executor | None = None,
+        callback_result: Callable[[Any], None] | None = None,
+        nearest_colors: NearestColorIndex | Mapping[str, str] | bool | None = None,
+        color_space: str = "hsv",
+        with_alpha: bool = False,
+        resizable: bool = False,
         **slider_kwargs: Any,
     ) -> None:
         """Create a color picker widget.
@@ -58,15 +73,52 @@ class CTkColorPicker(customtkinter.CTkFrame):
         orientation : str
             Orientation of the slider, either ``"vertical"`` or
             ``"horizontal"``.
+        max_update_rate : float | None
+            Maximum number of color updates per second while dragging the
+            wheel or the slider. ``None`` updates on every event.
+        shade_wheel : bool
+            Darken the wheel to match the brightness slider.
+        callback_mode : str
+            When ``command`` is called: ``"change"`` for every change,
+            ``"throttle"`` at most ``callback_rate`` times per second,
+            ``"debounce"`` after ``callback_delay`` ms without changes or
+            ``"release"`` only when the mouse button is released.
+        callback_rate : float
+            Maximum calls per second in ``"throttle"`` mode.
+        callback_delay : int
+            Quiet period in milliseconds for ``"debounce"`` mode.
+        callback_executor : Executor | None
+            Executor (e.g. a ``ThreadPoolExecutor``) running ``command`` off
+            the Tk thread. Newer colors supersede queued ones.
+        callback_result : Callable[[Any], None] | None
+            Receives the return value of ``command`` on the Tk thread when
+            ``callback_executor`` is used.
+        nearest_colors : NearestColorIndex | Mapping[str, str] | bool | None
+            Show the name of the closest palette color under the entry:
+            ``True`` for the CSS named colors, or a mapping of names to hex
+            colors or a prebuilt :class:`NearestColorIndex`.
+        color_space : str
+            ``"hsv"`` for the classic wheel or ``"oklch"`` for a perceptual
+            wheel of OKLCH hue and relative chroma whose slider sets the
+            lightness. The OKLCH wheel needs NumPy.
+        with_alpha : bool
+            Add an opacity slider and a checkerboard preview; colors are
+            then read and accepted as ``#rrggbbaa``.
+        resizable : bool
+            Grow and shrink the wheel with the space the widget is given,
+            e.g. when packed with ``fill="both", expand=True``; ``width``
+            then only sets the size used until the first layout.
         **slider_kwargs : Any
-            Additional keyword arguments passed to the slider.
+            Additional keyword arguments passed to the sliders.
         """
 
+        watch = stopwatch("construct")
         super().__init__(master=master, corner_radius=corner_radius)
 
         WIDTH = width if width >= 200 else 200
-        self.image_dimension = int(self._apply_widget_scaling(WIDTH - 100))
-        self.target_dimension = int(self._apply_widget_scaling(20))
+        self._picker_width = WIDTH
+        self.image_dimension = self._scaled(WIDTH - 100)
+        self.target_dimension = self._scaled(TARGET_SIZE)
         self.lift()
 
         self.after(10)
@@ -82,6 +134,15 @@ class CTkColorPicker(customtkinter.CTkFrame):
         self.corner_radius = corner_radius
 
         self.command = command
+        self._callback = CallbackDispatcher(
+            self,
+            self._run_command,
+            mode=callback_mode,
+            rate=callback_rate,
+            delay=callback_delay,
+            executor=callback_executor,
+            on_result=callback_result,
+        )
 
         self.slider_border = 10 if slider_border >= 10 else slider_border
 
@@ -95,29 +156,66 @@ class CTkColorPicker(customtkinter.CTkFrame):
             highlightthickness=0,
             bg=self.fg_color,
         )
-        self.canvas.bind("<Button-1>", self.on_mouse_drag)
-        self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
-
-        with Image.open(os.path.join(PATH, "color_wheel.png")) as img:
-            self.img1 = img.resize(
-                (self.image_dimension, self.image_dimension),
-                Image.Resampling.LANCZOS,
-            )
-            self.wheel = ImageTk.PhotoImage(self.img1)
-
-        # Build hue angle map
-        self._hue_lookup = build_hue_to_angle_lookup(self.img1)
-
-        with Image.open(os.path.join(PATH, "target.png")) as img:
-            self.img2 = img.resize(
-                (self.target_dimension, self.target_dimension),
-                Image.Resampling.LANCZOS,
-            )
-            self.target = ImageTk.PhotoImage(self.img2)
-
-        self.canvas.create_image(
+        if resizable:
+            # Request only the smallest wheel, so the canvas rather than
+            # the widgets packed after it gives way when space shrinks.
+            minimum = self._scaled(MIN_WHEEL_SIZE)
+            self.canvas.configure(width=minimum, height=minimum)
+        self._drag_scheduler = LatestWinsScheduler(
+            self, self.on_mouse_drag, max_update_rate
+        )
+        self._slider_scheduler = LatestWinsScheduler(
+            self, self.update_colors, max_update_rate
+        )
+        self._alpha_scheduler = LatestWinsScheduler(
+            self, self.update_alpha, max_update_rate
+        )
+        self._resizable = resizable
+        self._laid_out = False
+        self._origin_x = self._origin_y = 0
+        self._preview_source: Image.Image | None = None
+        self._preview_photo: ImageTk.PhotoImage | None = None
+        self._preview_item: int | None = None
+        self._resize_scheduler = LatestWinsScheduler(
+            self, self._preview_resize, max_update_rate
+        )
+        self._resize_debouncer = Debouncer(self, self._fit_wheel, DEFAULT_RESIZE_DELAY)
+        if resizable:
+            self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.canvas.bind("<Button-1>", self._on_mouse_press)
+        self.canvas.bind("<B1-Motion>", self._drag_scheduler.submit)
+        self.canvas.bind("<ButtonRelease-1>", self._on_mouse_release)
+
+        assets = get_wheel_assets(
+            self,
+            self.image_dimension,
+            self.target_dimension,
+            self._scaling(),
+            color_space=color_space,
+        )
+        watch.lap("assets")
+        self._assets = assets
+        self.model = PickerModel(
+            self.image_dimension,
+            assets.hue_lookup,
+            assets.index,
+            color_space=color_space,
+            with_alpha=with_alpha,
+        )
+        self._shade_wheel = shade_wheel
+        self._shaded_wheel: ImageTk.PhotoImage | None = None
+        self._wheel_brightness = assets.base_brightness
+        self.img1 = assets.wheel_image
+        self.wheel = assets.wheel
+        self.img2 = assets.target_image
+        self.target = assets.target
+
+        self._wheel_item = self.canvas.create_image(
             self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
         )
+        self._target_item = self.canvas.create_image(
+            self.image_dimension / 2, self.image_dimension / 2, image=self.target
+        )
         self.brightness_slider_value = customtkinter.IntVar()
         self.brightness_slider_value.set(255)
 
@@ -133,10 +231,52 @@ class CTkColorPicker(customtkinter.CTkFrame):
             number_of_steps=256,
             button_corner_radius=self.corner_radius,
             corner_radius=self.corner_radius,
-            command=lambda x: self.update_colors(),
+            command=lambda x: self._slider_scheduler.submit(),
             orientation=orientation,
             **slider_kwargs,
         )
+        self.slider.bind("<ButtonRelease-1>", self._on_slider_release)
+
+        self.alpha_slider: customtkinter.CTkSlider | None = None
+        self.swatch: tkinter.Canvas | None = None
+        self._swatch_image: ImageTk.PhotoImage | None = None
+        self._swatch_color: tuple | None = None
+        if with_alpha:
+            self.alpha_slider_value = customtkinter.IntVar(value=255)
+            self.alpha_slider = customtkinter.CTkSlider(
+                master=self.wheel_frame,
+                width=20,
+                border_width=self.slider_border,
+                button_length=15,
+                from_=0,
+                to=255,
+                variable=self.alpha_slider_value,
+                number_of_steps=256,
+                button_corner_radius=self.corner_radius,
+                corner_radius=self.corner_radius,
+                command=lambda x: self._alpha_scheduler.submit(),
+                orientation=orientation,
+                **slider_kwargs,
+            )
+            self.alpha_slider.bind("<ButtonRelease-1>", self._on_alpha_release)
+            self._swatch_size = (
+                self.image_dimension,
+                self._scaled(SWATCH_HEIGHT),
+            )
+            self.swatch = tkinter.Canvas(
+                self,
+                width=self._swatch_size[0],
+                height=self._swatch_size[1],
+                highlightthickness=0,
+                bg=self.fg_color,
+            )
+            self._swatch_image = ImageTk.PhotoImage(
+                "RGB", self._swatch_size, master=self
+            )
+            self._swatch_item = self.swatch.create_image(
+                0, 0, anchor="nw", image=self._swatch_image
+            )
+            self._update_swatch()
 
         self.entry = customtkinter.CTkEntry(
             master=self,
@@ -146,192 +286,196 @@ class CTkColorPicker(customtkinter.CTkFrame):
             corner_radius=self.corner_radius,
             justify="center",
         )
-        self.entry.insert(0, self.default_hex_color)
+        self.entry.insert(0, self._with_alpha(self.default_hex_color))
         self.entry.bind("<FocusOut>", self.apply_hex_input)
         self.entry.bind("<Return>", self.apply_hex_input)
 
+        self._nearest = nearest_color_index(nearest_colors)
+        self.nearest_label: customtkinter.CTkLabel | None = None
+        if self._nearest is not None:
+            self.nearest_label = customtkinter.CTkLabel(master=self, text="")
+
+        grow = {"fill": "both", "expand": True} if resizable else {}
         if orientation == "vertical":
-            self.canvas.pack(pady=20, side="left", padx=(10, 0))
+            self.canvas.pack(pady=20, side="left", padx=(10, 0), **grow)
             self.slider.pack(
                 fill="y", pady=15, side="right", padx=(10, 10 - self.slider_border)
             )
-            self.wheel_frame.pack(side="top")
+            if self.alpha_slider is not None:
+                self.alpha_slider.pack(fill="y", pady=15, side="right", padx=(10, 0))
+            self.wheel_frame.pack(side="top", **grow)
+            if self.swatch is not None:
+                self.swatch.pack(padx=10, pady=(0, 10))
             self.entry.pack(fill="x", padx=10, pady=(0, 15))
+            if self.nearest_label is not None:
+                self.nearest_label.pack(fill="x", padx=10, pady=(0, 10))
         else:
             try:
                 self.entry.configure(wraplength=100)
             except (tkinter.TclError, ValueError):
                 pass
-            self.canvas.pack(pady=(0, 15))
+            self.canvas.pack(pady=(0, 15), **grow)
             self.slider.pack(fill="x", pady=(0, 10 - self.slider_border))
-            self.wheel_frame.pack(pady=15, padx=15)
+            if self.alpha_slider is not None:
+                self.alpha_slider.pack(fill="x", pady=(0, 10 - self.slider_border))
+            self.wheel_frame.pack(pady=15, padx=15, **grow)
+            if self.swatch is not None:
+                self.swatch.pack(padx=15, pady=(0, 15))
             self.entry.pack(expand=True, fill="both", padx=15, pady=(0, 15))
+            if self.nearest_label is not None:
+                self.nearest_label.pack(fill="x", padx=15, pady=(0, 10))
+        watch.lap("widgets")
 
         self.set_initial_color(initial_color)
+        watch.stop("initial_color")
 
     def get(self) -> str:
-        """Return the currently selected color as a hexadecimal string."""
+        """Return the currently selected color as a hexadecimal string.
+
+        The color is ``#rrggbbaa`` when the picker was created
+        ``with_alpha``.
+        """
 
-        self._color = self.entry._fg_color
+        self._color = self._with_alpha(self.entry._fg_color)
         return self._color
 
     def destroy(self) -> None:
         """Destroy the widget and free associated image resources."""
 
+        self._drag_scheduler.cancel()
+        self._slider_scheduler.cancel()
+        self._alpha_scheduler.cancel()
+        self._resize_scheduler.cancel()
+        self._resize_debouncer.cancel()
+        self._callback.cancel()
         super().destroy()
         del self.img1
         del self.img2
         del self.wheel
         del self.target
 
+    def _on_mouse_press(self, event: tkinter.Event) -> None:
+        """Apply a click immediately, discarding older queued motion."""
+
+        self._resize_debouncer.flush()
+        self._drag_scheduler.cancel()
+        self.on_mouse_drag(event)
+
+    def _on_mouse_release(self, event: tkinter.Event) -> None:
+        """Apply the latest queued drag position when the button is released."""
+
+        self._drag_scheduler.flush()
+        self._callback.release()
+
+    def _on_slider_release(self, event: tkinter.Event) -> None:
+        """Apply the latest queued slider value when the button is released."""
+
+        self._slider_scheduler.flush()
+        self._callback.release()
+
+    def _on_alpha_release(self, event: tkinter.Event) -> None:
+        """Apply the latest queued alpha value when the button is released."""
+
+        self._alpha_scheduler.flush()
+        self._callback.release()
+
+    def _run_command(self, color: str) -> Any:
+        """Call the current ``command`` with ``color``."""
+
+        if not self.command:
+            return None
+        if not instrumentation.enabled:
+            return self.command(color)
+        start = time.perf_counter()
+        try:
+            return self.command(color)
+        finally:
+            instrumentation.record("command", time.perf_counter() - start)
+
     def on_mouse_drag(self, event: tkinter.Event) -> None:
         """Move the target when the user clicks or drags on the wheel."""
 
-        x = event.x
-        y = event.y
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
+        watch = stopwatch("drag")
+        self.model.move_to(event.x - self._origin_x, event.y - self._origin_y)
+        watch.lap("model")
+        self._move_target()
+        self._show_color()
+        watch.lap("render")
 
-        d_from_center = math.sqrt(
-            ((self.image_dimension / 2) - x) ** 2
-            + ((self.image_dimension / 2) - y) ** 2
-        )
+        if self.command:
+            self._callback(self.get())
+            watch.lap("command")
+        watch.stop()
 
-        if d_from_center < self.image_dimension / 2:
-            self.target_x, self.target_y = x, y
-        else:
-            self.target_x, self.target_y = projection_on_circle(
-                x,
-                y,
-                self.image_dimension / 2,
-                self.image_dimension / 2,
-                self.image_dimension / 2 - 1,
-            )
+    def _scaled(self, value: float) -> int:
+        """Return ``value`` in pixels at the widget scaling."""
 
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
+        return int(self._apply_widget_scaling(value))
 
-        self.update_colors()
+    def _scaling(self) -> float:
+        """Return the widget scaling the wheel is rasterized at."""
+
+        return self._get_widget_scaling()
 
     def update_colors(self) -> None:
         """Update widget colors and invoke the callback if provided."""
 
-        brightness = self.brightness_slider_value.get()
-        self.rgb_color, self.default_hex_color = utils_update_colors(
-            self.img1,
-            getattr(self, "target_x", 0),
-            getattr(self, "target_y", 0),
-            brightness,
-            self.slider,
-            self.entry,
-            command=self.command,
-            get_callback=self.get,
-            angle_lookup=self._hue_lookup,
-        )
+        watch = stopwatch("slider")
+        self.model.set_brightness(self.brightness_slider_value.get())
+        watch.lap("model")
+        self._update_wheel_shade()
+        watch.lap("shade")
+        self._show_color()
+        watch.lap("render")
+
+        if self.command:
+            self._callback(self.get())
+            watch.lap("command")
+        watch.stop()
+
+    def update_alpha(self) -> None:
+        """Apply the alpha slider and invoke the callback if provided."""
+
+        watch = stopwatch("alpha")
+        self.model.set_alpha(self.alpha_slider_value.get())
+        watch.lap("model")
+        self._show_color()
+        watch.lap("render")
+
+        if self.command:
+            self._callback(self.get())
+            watch.lap("command")
+        watch.stop()
 
     def apply_hex_input(self, event: tkinter.Event | None = None) -> None:
         """Validate and apply the hex color entered by the user."""
 
-        value = self.entry.get().strip()
-        normalized = normalize_hex(value)
-        if normalized is None:
-            self.entry.delete(0, "end")
-            self.entry.insert(0, self.default_hex_color)
-            self.entry.configure(fg_color=self.default_hex_color)
-            self.slider.configure(progress_color=self.default_hex_color)
+        if not self.model.set_hex(self.entry.get().strip()):
+            set_entry_text(self.entry, self._with_alpha(self.default_hex_color))
+            configure_changed(self.entry, fg_color=self.default_hex_color)
+            configure_changed(self.slider, progress_color=self.default_hex_color)
+            self.model.brightness = 255
             self.brightness_slider_value.set(255)
+            self._update_wheel_shade()
             self.entry.focus()
             return
 
-        r, g, b = tuple(int(normalized[i : i + 2], 16) for i in (1, 3, 5))
-        h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-        value = int(v * 255)
-        self.brightness_slider_value.set(value)
-
-        try:
-            angle = hue_to_angle(h, self._hue_lookup)
-        except Exception:
-            angle = (h * TAU) % TAU  # safety fallback
-
-        radius = s * (self.image_dimension / 2 - 1)
-        self.target_x = self.image_dimension / 2 + radius * math.cos(angle)
-        self.target_y = self.image_dimension / 2 - radius * math.sin(angle)
-
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
-
-        self.default_hex_color = normalized
-        rgb = [r, g, b]
-        self.rgb_color = rgb[:]
-        self.default_rgb = rgb[:]
-        self.entry.delete(0, "end")
-        self.entry.insert(0, normalized)
-        self.entry.configure(fg_color=normalized)
-        self.slider.configure(progress_color=normalized)
-
-        brightness = 0.299 * r + 0.587 * g + 0.114 * b
-        if brightness < 70 or normalized == "#000000":
-            self.entry.configure(text_color="white")
-        else:
-            self.entry.configure(text_color="black")
+        self._show_model()
 
         if self.command:
-            self.command(self.get())
-
-    def set_initial_color(self, initial_color: str | None) -> None:
-        """Position the target and widgets to match ``initial_color``."""
+            self._callback.fire(self.get())
 
-        normalized = normalize_hex(initial_color) if initial_color else None
-        if normalized is not None:
-            r, g, b = tuple(int(normalized[i : i + 2], 16) for i in (1, 3, 5))
-            h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+    def set_initial_color(self, initial_color: str | None, notify: bool = True) -> None:
+        """Position the target and widgets to match ``initial_color``.
 
-            value = int(v * 255)
-            self.brightness_slider_value.set(value)
-
-            try:
-                angle = hue_to_angle(h, self._hue_lookup)
-            except Exception:
-                angle = (h * TAU) % TAU  # safety fallback
-
-            radius = s * (self.image_dimension / 2 - 1)
-            self.target_x = self.image_dimension / 2 + radius * math.cos(angle)
-            self.target_y = self.image_dimension / 2 - radius * math.sin(angle)
+        ``command`` is called with the new color unless ``notify`` is false.
+        """
 
-            self.canvas.delete("all")
-            self.canvas.create_image(
-                self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-            )
-            self.canvas.create_image(self.target_x, self.target_y, image=self.target)
-
-            self.default_hex_color = normalized
-            rgb = [r, g, b]
-            self.rgb_color = rgb[:]
-            self.default_rgb = rgb[:]
-
-            self.entry.delete(0, "end")
-            self.entry.insert(0, normalized)
-            self.entry.configure(fg_color=normalized)
-            self.slider.configure(progress_color=normalized)
-
-            brightness = 0.299 * r + 0.587 * g + 0.114 * b
-            if brightness < 70 or normalized == "#000000":
-                self.entry.configure(text_color="white")
-            else:
-                self.entry.configure(text_color="black")
-
-            if self.command:
-                self.command(self.get())
+        if initial_color and self.model.set_hex(initial_color):
+            self._show_model()
+            if notify and self.command:
+                self._callback.fire(self.get())
             return
 
-        self.target_x = self.image_dimension / 2
-        self.target_y = self.image_dimension / 2
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self.image_dimension / 2, self.image_dimension / 2, image=self.wheel
-        )
-        self.canvas.create_image(self.target_x, self.target_y, image=self.target)
+        self.model.reset_position()
+        self._move_target()
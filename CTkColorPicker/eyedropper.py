@@ -0,0 +1,302 @@
+"""Screen eyedropper with a magnifier loupe.
+
+The eyedropper follows the mouse pointer anywhere on screen, grabbing only
+the few pixels around it at a fixed frame rate and showing them enlarged in a
+small borderless window next to the pointer. Clicking feeds the color under
+the pointer into the picker's hex entry and applies it through
+``apply_hex_input``; Escape or the right mouse button cancel::
+
+    picker = CTkColorPicker(root)
+    picker.pick_from_screen()
+"""
+
+import time
+import tkinter
+from typing import Any, Callable
+
+from PIL import Image, ImageGrab, ImageTk
+
+from .color_utils import set_entry_text
+from .instrumentation import stopwatch
+
+DEFAULT_FRAME_RATE = 30
+"""Loupe updates per second."""
+
+DEFAULT_SAMPLE_SIZE = 11
+"""Side length in screen pixels of the area shown in the loupe."""
+
+DEFAULT_ZOOM = 10
+"""Magnification of the loupe."""
+
+LOUPE_OFFSET = 24
+"""Distance in pixels between the pointer and the loupe window, which keeps
+the loupe out of the grabbed area."""
+
+_LABEL_HEIGHT = 20
+
+
+def capture_box(
+    x: int, y: int, radius: int, screen: tuple[int, int]
+) -> tuple[tuple[int, int, int, int], tuple[int, int]]:
+    """Return the on-screen part of the square around ``(x, y)``.
+
+    Returns
+    -------
+    tuple[tuple[int, int, int, int], tuple[int, int]]
+        The ``(left, top, right, bottom)`` box to grab, clipped to the
+        ``(width, height)`` of the screen, and where its top-left corner
+        goes in the full ``2 * radius + 1`` square.
+    """
+
+    left, top = max(x - radius, 0), max(y - radius, 0)
+    right = min(x + radius + 1, screen[0])
+    bottom = min(y + radius + 1, screen[1])
+    return (left, top, right, bottom), (left - (x - radius), top - (y - radius))
+
+
+def loupe_position(
+    x: int, y: int, size: tuple[int, int], screen: tuple[int, int]
+) -> tuple[int, int]:
+    """Return where to place a loupe of ``size`` next to the pointer.
+
+    The loupe sits below and to the right of the pointer and flips to the
+    other side near the right and bottom edges of the screen.
+    """
+
+    width, height = size
+    left = x + LOUPE_OFFSET
+    if left + width > screen[0]:
+        left = x - LOUPE_OFFSET - width
+    top = y + LOUPE_OFFSET
+    if top + height > screen[1]:
+        top = y - LOUPE_OFFSET - height
+    return max(left, 0), max(top, 0)
+
+
+class Eyedropper:
+    """Sample a color from the screen into a picker.
+
+    Every frame grabs a ``sample_size`` square around the pointer into a
+    reused buffer and pastes it, enlarged, into the loupe's existing photo
+    image. Frames are scheduled with ``after`` against a fixed clock, so a
+    slow frame shortens the next wait instead of delaying every later frame,
+    and the Tk loop handles other events between frames. Frames where the
+    pointer has not moved skip the loupe repositioning.
+    """
+
+    def __init__(
+        self,
+        picker: Any,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        zoom: int = DEFAULT_ZOOM,
+        frame_rate: float = DEFAULT_FRAME_RATE,
+        on_pick: Callable[[str], None] | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> None:
+        """Prepare an eyedropper; :meth:`start` shows it.
+
+        Parameters
+        ----------
+        picker : Any
+            :class:`AskColor` or :class:`CTkColorPicker` receiving the color.
+        sample_size : int
+            Side length in pixels of the sampled area; rounded up to an odd
+            number so the pointer pixel is centered.
+        zoom : int
+            Magnification of the loupe.
+        frame_rate : float
+            Loupe updates per second.
+        on_pick : Callable[[str], None] | None
+            Called with the picked color after it has been applied.
+        on_cancel : Callable[[], None] | None
+            Called when the eyedropper is cancelled.
+        """
+
+        self.picker = picker
+        self.radius = max(0, int(sample_size) // 2)
+        self.zoom = max(1, int(zoom))
+        self.interval = 1 / max(1.0, float(frame_rate))
+        self.on_pick = on_pick
+        self.on_cancel = on_cancel
+        self.color: str | None = None
+
+        side = 2 * self.radius + 1
+        self._buffer = Image.new("RGB", (side, side))
+        self._loupe: tkinter.Toplevel | None = None
+        self._photo: ImageTk.PhotoImage | None = None
+        self._canvas: tkinter.Canvas | None = None
+        self._label_item: int | None = None
+        self._after_id: str | None = None
+        self._next_frame = 0.0
+        self._pointer: tuple[int, int] | None = None
+        self._previous_grab: Any = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the loupe is shown."""
+
+        return self._loupe is not None
+
+    def start(self) -> None:
+        """Show the loupe and grab the pointer until a pick or cancel."""
+
+        if self._loupe is not None:
+            return
+        side = (2 * self.radius + 1) * self.zoom
+        self._previous_grab = self.picker.grab_current()
+
+        loupe = self._loupe = tkinter.Toplevel(self.picker)
+        loupe.withdraw()
+        loupe.overrideredirect(True)
+        loupe.attributes("-topmost", True)
+        loupe.configure(cursor="crosshair")
+        canvas = self._canvas = tkinter.Canvas(
+            loupe,
+            width=side,
+            height=side + _LABEL_HEIGHT,
+            highlightthickness=1,
+            highlightbackground="#000000",
+            borderwidth=0,
+            bg="#000000",
+        )
+        canvas.pack()
+        self._photo = ImageTk.PhotoImage("RGB", (side, side), master=loupe)
+        canvas.create_image(0, 0, anchor="nw", image=self._photo)
+        center = self.radius * self.zoom
+        canvas.create_rectangle(
+            center - 1,
+            center - 1,
+            center + self.zoom,
+            center + self.zoom,
+            outline="#ffffff",
+        )
+        self._label_item = canvas.create_text(
+            side / 2, side + _LABEL_HEIGHT / 2, fill="#ffffff", text=""
+        )
+
+        loupe.bind("<ButtonPress-1>", lambda e: self.pick())
+        loupe.bind("<ButtonPress-3>", lambda e: self.cancel())
+        loupe.bind("<Escape>", lambda e: self.cancel())
+
+        self._frame()
+        loupe.deiconify()
+        loupe.wait_visibility()
+        try:
+            loupe.grab_set_global()
+        except tkinter.TclError:  # another application holds the grab
+            loupe.grab_set()
+        loupe.focus_force()
+        self._next_frame = time.perf_counter()
+        self._schedule()
+
+    def pick(self) -> str | None:
+        """Apply the color under the pointer to the picker and stop.
+
+        The picker keeps its opacity; only the RGB color is replaced.
+
+        Returns
+        -------
+        str | None
+            The picked color, or ``None`` if the eyedropper is not active.
+        """
+
+        if self._loupe is None:
+            return None
+        self._frame()
+        color = self.color
+        self._stop()
+        if color is not None:
+            set_entry_text(self.picker.entry, self.picker._with_alpha(color))
+            self.picker.apply_hex_input()
+            if self.on_pick:
+                self.on_pick(color)
+        return color
+
+    def cancel(self) -> None:
+        """Stop without changing the picker."""
+
+        if self._loupe is None:
+            return
+        self._stop()
+        if self.on_cancel:
+            self.on_cancel()
+
+    def _stop(self) -> None:
+        """Release the grab, destroy the loupe and restore the previous grab."""
+
+        loupe, self._loupe = self._loupe, None
+        if self._after_id is not None:
+            try:
+                loupe.after_cancel(self._after_id)
+            except tkinter.TclError:
+                pass
+            self._after_id = None
+        try:
+            loupe.grab_release()
+            loupe.destroy()
+        except tkinter.TclError:
+            pass
+        self._photo = self._canvas = None
+        previous = self._previous_grab
+        self._previous_grab = None
+        if previous is not None:
+            try:
+                if previous.winfo_exists():
+                    previous.grab_set()
+            except tkinter.TclError:
+                pass
+
+    def _schedule(self) -> None:
+        """Queue the next frame on the fixed frame clock."""
+
+        self._next_frame += self.interval
+        delay = self._next_frame - time.perf_counter()
+        if delay < 0:
+            # Running late: drop the missed frames instead of catching up.
+            self._next_frame = time.perf_counter()
+            delay = 0.0
+        self._after_id = self._loupe.after(max(1, int(delay * 1000)), self._tick)
+
+    def _tick(self) -> None:
+        """Update the loupe and queue the next frame."""
+
+        self._after_id = None
+        if self._loupe is None:
+            return
+        try:
+            self._frame()
+        except tkinter.TclError:  # the picker was destroyed
+            self._stop()
+            return
+        self._schedule()
+
+    def _frame(self) -> None:
+        """Grab the pixels around the pointer and show them in the loupe."""
+
+        watch = stopwatch("eyedropper")
+        loupe = self._loupe
+        x, y = loupe.winfo_pointerxy()
+        screen = (loupe.winfo_screenwidth(), loupe.winfo_screenheight())
+        box, offset = capture_box(x, y, self.radius, screen)
+        buffer = self._buffer
+        if box[0] < box[2] and box[1] < box[3]:
+            try:
+                grabbed = ImageGrab.grab(bbox=box)
+            except OSError:  # display unavailable for this frame
+                grabbed = None
+            if grabbed is not None:
+                if grabbed.size != buffer.size:
+                    buffer.paste(0, (0, 0, *buffer.size))
+                buffer.paste(grabbed.convert("RGB"), offset)
+        watch.lap("grab")
+
+        side = buffer.size[0] * self.zoom
+        self._photo.paste(buffer.resize((side, side), Image.NEAREST))
+        r, g, b = buffer.getpixel((self.radius, self.radius))
+        self.color = f"#{r:02x}{g:02x}{b:02x}"
+        self._canvas.itemconfigure(self._label_item, text=self.color)
+        if (x, y) != self._pointer:
+            self._pointer = (x, y)
+            left, top = loupe_position(x, y, (side, side + _LABEL_HEIGHT), screen)
+            loupe.geometry(f"+{left}+{top}")
+        watch.stop("render")
@@ -0,0 +1,267 @@
+"""Opt-in latency instrumentation of the picker hot paths.
+
+Instrumentation is off by default, and nothing is timed or stored until
+:func:`enable` is called (or the ``CTKCOLORPICKER_INSTRUMENT`` environment
+variable is set to a non-empty value other than ``0`` at import time).
+Until then :func:`stopwatch` returns a shared no-op stopwatch, so an
+instrumented handler costs one flag check plus two or three empty method
+calls.
+
+Once enabled, timings are kept per stage name in rolling windows, e.g.
+``"drag"`` for a whole wheel motion event and ``"drag.model"``,
+``"drag.render"`` and ``"drag.command"`` for its parts. Sinks registered with
+:func:`add_sink` receive a snapshot of every stage periodically::
+
+    from CTkColorPicker import instrumentation
+
+    instrumentation.enable()
+    instrumentation.add_sink(instrumentation.log_sink(), interval=30)
+    ...
+    instrumentation.summary()["drag"].p99
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+INSTRUMENT_ENV = "CTKCOLORPICKER_INSTRUMENT"
+"""Environment variable enabling instrumentation at import time."""
+
+DEFAULT_WINDOW = 1024
+"""Number of most recent samples kept per stage."""
+
+enabled = False
+"""Whether timings are recorded. Use :func:`enable` and :func:`disable`."""
+
+
+class Stats(NamedTuple):
+    """Latency percentiles of one stage, in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+def _quantile(ordered: list[float], fraction: float) -> float:
+    """Return the ``fraction`` quantile of sorted samples, ``0.0`` if empty."""
+
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LatencyHistogram:
+    """Rolling window of the latest ``window`` samples of one stage.
+
+    ``count`` keeps growing after old samples have been dropped, so it
+    reports how often the stage ran in total.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """Create an empty histogram keeping ``window`` samples."""
+
+        self.samples: "deque[float]" = deque(maxlen=max(1, int(window)))
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """Add one sample."""
+
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Return the ``fraction`` (0..1) quantile of the window, or ``0.0``."""
+
+        return _quantile(sorted(self.samples), fraction)
+
+    def stats(self) -> Stats:
+        """Return the percentiles of the current window."""
+
+        ordered = sorted(self.samples)
+        if not ordered:
+            return Stats(self.count, 0.0, 0.0, 0.0, 0.0, 0.0)
+        return Stats(
+            self.count,
+            sum(ordered) / len(ordered),
+            _quantile(ordered, 0.5),
+            _quantile(ordered, 0.9),
+            _quantile(ordered, 0.99),
+            ordered[-1],
+        )
+
+
+class Stopwatch:
+    """Record the stages of one operation under a common prefix.
+
+    Get one from :func:`stopwatch`, which hands out a no-op stand-in while
+    instrumentation is off, so call sites need no checks::
+
+        watch = stopwatch("drag")
+        ...
+        watch.lap("model")
+        ...
+        watch.stop("render")
+    """
+
+    __slots__ = ("name", "_start", "_last")
+
+    def __init__(self, name: str) -> None:
+        """Start timing the operation ``name``."""
+
+        self.name = name
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Record the time since the previous lap as ``"<name>.<stage>"``."""
+
+        now = time.perf_counter()
+        record(f"{self.name}.{stage}", now - self._last)
+        self._last = now
+
+    def stop(self, stage: str | None = None) -> None:
+        """Record the total time as ``name``, after a last :meth:`lap` if
+        ``stage`` is given."""
+
+        if stage is not None:
+            self.lap(stage)
+        record(self.name, time.perf_counter() - self._start)
+
+
+class _NullStopwatch:
+    """:class:`Stopwatch` stand-in that records nothing."""
+
+    __slots__ = ()
+
+    def lap(self, stage: str) -> None:
+        pass
+
+    def stop(self, stage: str | None = None) -> None:
+        pass
+
+
+_NULL_STOPWATCH = _NullStopwatch()
+
+
+def stopwatch(name: str) -> "Stopwatch | _NullStopwatch":
+    """Start timing the operation ``name`` if :data:`enabled`.
+
+    While instrumentation is off this returns a shared stopwatch whose
+    :meth:`~Stopwatch.lap` and :meth:`~Stopwatch.stop` do nothing.
+    """
+
+    return Stopwatch(name) if enabled else _NULL_STOPWATCH
+
+
+_lock = threading.Lock()
+_histograms: dict[str, LatencyHistogram] = {}
+_window = DEFAULT_WINDOW
+_sinks: list[list] = []
+
+
+def enable(window: int = DEFAULT_WINDOW) -> None:
+    """Start recording, keeping the latest ``window`` samples per stage."""
+
+    global enabled, _window
+
+    _window = max(1, int(window))
+    enabled = True
+
+
+def disable() -> None:
+    """Stop recording. Collected samples are kept until :func:`reset`."""
+
+    global enabled
+
+    enabled = False
+
+
+def record(name: str, seconds: float) -> None:
+    """Add a sample to the stage ``name`` and feed sinks that are due."""
+
+    now = time.monotonic()
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram(_window)
+        histogram.record(seconds)
+        due = [entry for entry in _sinks if now >= entry[2]]
+        for entry in due:
+            entry[2] = now + entry[1]
+    if due:
+        snapshot = summary()
+        for entry in due:
+            entry[0](snapshot)
+
+
+def histograms() -> dict[str, LatencyHistogram]:
+    """Return the histograms by stage name; treat them as read-only."""
+
+    with _lock:
+        return dict(_histograms)
+
+
+def summary() -> dict[str, Stats]:
+    """Return the percentiles of every stage."""
+
+    with _lock:
+        return {name: histogram.stats() for name, histogram in _histograms.items()}
+
+
+def reset() -> None:
+    """Drop every recorded sample."""
+
+    with _lock:
+        _histograms.clear()
+
+
+def add_sink(sink: Callable[[dict[str, Stats]], None], interval: float = 10.0) -> None:
+    """Call ``sink`` with :func:`summary` at most every ``interval`` seconds.
+
+    Sinks are called from :func:`record`, i.e. from the thread recording a
+    sample once the interval has elapsed, and only while samples come in.
+    """
+
+    with _lock:
+        _sinks.append([sink, float(interval), time.monotonic() + interval])
+
+
+def remove_sink(sink: Callable[[dict[str, Stats]], None]) -> None:
+    """Stop calling ``sink``."""
+
+    with _lock:
+        _sinks[:] = [entry for entry in _sinks if entry[0] is not sink]
+
+
+def log_sink(
+    logger: logging.Logger | None = None, level: int = logging.INFO
+) -> Callable[[dict[str, Stats]], None]:
+    """Return a sink writing one line per stage to ``logger``."""
+
+    logger = logger or logging.getLogger(__package__)
+
+    def sink(snapshot: dict[str, Stats]) -> None:
+        for name in sorted(snapshot):
+            stats = snapshot[name]
+            logger.log(
+                level,
+                "%s: n=%d mean=%.3fms p50=%.3fms p90=%.3fms p99=%.3fms max=%.3fms",
+                name,
+                stats.count,
+                stats.mean * 1000,
+                stats.p50 * 1000,
+                stats.p90 * 1000,
+                stats.p99 * 1000,
+                stats.max * 1000,
+            )
+
+    return sink
+
+
+if os.environ.get(INSTRUMENT_ENV, "0") not in ("", "0"):
+    enable()
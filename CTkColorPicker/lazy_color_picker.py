@@ -0,0 +1,244 @@
+"""Placeholder that builds a :class:`CTkColorPicker` only when it is needed."""
+
+import tkinter
+from collections import OrderedDict
+from typing import Any, Callable
+
+import customtkinter
+
+from .color_utils import normalize_hex, readable_text_color
+from .ctk_color_picker_widget import CTkColorPicker
+
+EXPAND_MODES = ("click", "visible")
+"""Accepted values of the ``expand_on`` option."""
+
+DEFAULT_MAX_EXPANDED = 4
+"""Number of full pickers kept alive before the least recently used one is
+collapsed back to its swatch. Rows expanded because they are on screen are
+never collapsed to make room."""
+
+
+class LazyColorPicker(customtkinter.CTkFrame):
+    """A color swatch that turns into a full :class:`CTkColorPicker`.
+
+    Until it is expanded the widget is a single button showing the color and
+    its hex value, so long lists of colors stay cheap to create. The full
+    picker is built on click (``expand_on="click"``) or as soon as the row is
+    shown (``expand_on="visible"``), and destroyed again by :meth:`collapse`.
+    Inside scrolled containers, call :meth:`update_visibility` after
+    scrolling so ``"visible"`` rows follow the view.
+    At most :data:`max_expanded` pickers exist at once across all instances;
+    expanding another one collapses the least recently expanded, skipping
+    ``expand_on="visible"`` rows that are still on screen. Those only
+    collapse when they scroll out of view, so the limit may be exceeded
+    while more of them are visible.
+    """
+
+    max_expanded = DEFAULT_MAX_EXPANDED
+    _expanded: "OrderedDict[LazyColorPicker, None]" = OrderedDict()
+
+    def __init__(
+        self,
+        master: Any | None = None,
+        initial_color: str | None = None,
+        command: Callable[[str], None] | None = None,
+        expand_on: str = "click",
+        swatch_height: int = 28,
+        corner_radius: int = 24,
+        **picker_kwargs: Any,
+    ) -> None:
+        """Create a collapsed picker.
+
+        Parameters
+        ----------
+        master : Any | None
+            Parent widget.
+        initial_color : str | None
+            Starting color in hexadecimal format.
+        command : Callable[[str], None] | None
+            Callback invoked with the selected color whenever it changes.
+        expand_on : str
+            ``"click"`` to build the picker when the swatch is clicked or
+            ``"visible"`` to build it while the widget is on screen and
+            collapse it when it is unmapped or scrolled out of view.
+        swatch_height : int
+            Height of the collapsed swatch in pixels.
+        corner_radius : int
+            Corner radius of the swatch and the picker.
+        **picker_kwargs : Any
+            Options passed to :class:`CTkColorPicker` when it is built.
+
+        Raises
+        ------
+        ValueError
+            If ``expand_on`` is not one of :data:`EXPAND_MODES`.
+        """
+
+        if expand_on not in EXPAND_MODES:
+            raise ValueError(
+                f"expand_on must be one of {', '.join(EXPAND_MODES)}, "
+                f"got {expand_on!r}"
+            )
+        super().__init__(master=master, fg_color="transparent", corner_radius=0)
+
+        self.command = command
+        self.expand_on = expand_on
+        self.corner_radius = corner_radius
+        self._picker_kwargs = picker_kwargs
+        self._allow_alpha = bool(picker_kwargs.get("with_alpha"))
+        self._color = normalize_hex(initial_color, self._allow_alpha) or "#ffffff"
+        self.picker: CTkColorPicker | None = None
+
+        self.swatch = customtkinter.CTkButton(
+            self,
+            height=swatch_height,
+            corner_radius=corner_radius,
+            command=self.expand,
+        )
+        self._show_swatch_color()
+        self.swatch.pack(fill="x")
+
+        if expand_on == "visible":
+            self.bind("<Map>", lambda e: self.after_idle(self.update_visibility))
+            self.bind("<Unmap>", lambda e: self.after_idle(self.update_visibility))
+
+    @property
+    def expanded(self) -> bool:
+        """Whether the full picker is currently built."""
+
+        return self.picker is not None
+
+    def get(self) -> str:
+        """Return the current color as a hexadecimal string."""
+
+        if self.picker is not None:
+            return self.picker.get()
+        return self._color
+
+    def set_initial_color(self, initial_color: str | None) -> None:
+        """Select ``initial_color`` without building the picker."""
+
+        normalized = normalize_hex(initial_color, self._allow_alpha)
+        if normalized is None:
+            return
+        self._color = normalized
+        if self.picker is not None:
+            self.picker.set_initial_color(normalized, notify=False)
+        else:
+            self._show_swatch_color()
+
+    def expand(self) -> None:
+        """Replace the swatch with a full picker.
+
+        Building the picker does not call ``command``; the color is
+        unchanged.
+        """
+
+        cls = type(self)
+        if self.picker is not None:
+            cls._expanded.move_to_end(self)
+            return
+        limit = max(1, cls.max_expanded)
+        for other in list(cls._expanded):
+            if len(cls._expanded) < limit:
+                break
+            if not other._shown_on_screen():
+                other.collapse()
+
+        # Connected only once built: the initial color is not a change.
+        self.picker = CTkColorPicker(
+            self,
+            initial_color=self._color,
+            corner_radius=self.corner_radius,
+            **self._picker_kwargs,
+        )
+        self.picker.command = self._on_change
+        self.swatch.pack_forget()
+        self.picker.pack(fill="both", expand=True)
+        cls._expanded[self] = None
+
+    def collapse(self) -> None:
+        """Destroy the full picker and show the swatch again."""
+
+        type(self)._expanded.pop(self, None)
+        if self.picker is None:
+            return
+        self._color = self.picker.get()
+        picker, self.picker = self.picker, None
+        picker.destroy()
+        self._show_swatch_color()
+        self.swatch.pack(fill="x")
+
+    def destroy(self) -> None:
+        """Destroy the widget and forget it in the expanded set."""
+
+        type(self)._expanded.pop(self, None)
+        self.picker = None
+        super().destroy()
+
+    def _on_change(self, color: str) -> None:
+        """Remember the picker's color and forward it to ``command``."""
+
+        self._color = color
+        if self.command:
+            self.command(color)
+
+    def _show_swatch_color(self) -> None:
+        """Paint the swatch with the current color, ignoring its alpha."""
+
+        opaque = self._color[:7]
+        r, g, b = (int(opaque[i : i + 2], 16) for i in (1, 3, 5))
+        self.swatch.configure(
+            text=self._color,
+            fg_color=opaque,
+            hover_color=opaque,
+            text_color=readable_text_color(r, g, b),
+        )
+
+    def update_visibility(self) -> None:
+        """Expand if the widget is on screen, collapse otherwise.
+
+        Only acts in ``expand_on="visible"`` mode.
+        """
+
+        if self.expand_on != "visible":
+            return
+        try:
+            visible = self._on_screen()
+        except tkinter.TclError:
+            return
+        if visible:
+            self.expand()
+        else:
+            self.collapse()
+
+    def _shown_on_screen(self) -> bool:
+        """Whether this is an ``expand_on="visible"`` row that is on screen."""
+
+        if self.expand_on != "visible":
+            return False
+        try:
+            return self._on_screen()
+        except tkinter.TclError:
+            return False
+
+    def _on_screen(self) -> bool:
+        """Whether part of the widget lies inside all of its ancestors."""
+
+        if not self.winfo_viewable():
+            return False
+        left, top = self.winfo_rootx(), self.winfo_rooty()
+        right, bottom = left + self.winfo_width(), top + self.winfo_height()
+        toplevel = self.winfo_toplevel()
+        widget = self.master
+        while widget is not None:
+            x, y = widget.winfo_rootx(), widget.winfo_rooty()
+            left, top = max(left, x), max(top, y)
+            right = min(right, x + widget.winfo_width())
+            bottom = min(bottom, y + widget.winfo_height())
+            if left >= right or top >= bottom:
+                return False
+            if widget is toplevel:
+                break
+            widget = widget.master
+        return True
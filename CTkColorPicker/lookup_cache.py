@@ -0,0 +1,146 @@
+"""Persistent on-disk cache of hue lookup tables.
+
+Tables are stored as raw little-endian float64 files, two rows of
+``samples`` values (hues, then angles), in the user cache directory. The file
+name holds a format version and a digest of the wheel image, its size and
+the sampling parameters, so a changed wheel never reuses a stale table. With
+NumPy the tables are memory-mapped; otherwise they are read into
+:class:`array.array` objects.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from array import array
+from typing import Sequence
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from .color_utils import build_hue_to_angle_lookup
+
+CACHE_VERSION = 1
+"""Bumped whenever the file layout or the lookup algorithm changes."""
+
+CACHE_DIR_ENV = "CTKCOLORPICKER_CACHE_DIR"
+"""Environment variable overriding the cache directory."""
+
+
+def cache_dir() -> str:
+    """Return the directory holding the cached lookup tables."""
+
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "CTkColorPicker")
+
+
+def _cache_path(image: Image.Image, samples: int, ring: float, key: str | None) -> str:
+    """Return the cache file path for ``image`` and the sampling parameters."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.size}:{samples}:{ring!r}".encode())
+    if key is None:
+        digest.update(image.tobytes())
+    else:
+        digest.update(key.encode())
+    name = f"hue_lookup-v{CACHE_VERSION}-{digest.hexdigest()}.f64"
+    return os.path.join(cache_dir(), name)
+
+
+def _read(path: str, samples: int) -> tuple[Sequence[float], Sequence[float]] | None:
+    """Load a cached table, returning ``None`` if it is missing or malformed."""
+
+    try:
+        if os.path.getsize(path) != 2 * samples * 8:
+            return None
+        if np is not None:
+            table = np.memmap(path, dtype="<f8", mode="r", shape=(2, samples))
+            return table[0], table[1]
+        values = array("d")
+        with open(path, "rb") as file:
+            values.fromfile(file, 2 * samples)
+    except (OSError, ValueError, EOFError):
+        return None
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values[:samples], values[samples:]
+
+
+def _write(path: str, lookup: tuple[Sequence[float], Sequence[float]]) -> None:
+    """Store ``lookup`` atomically; failures are ignored."""
+
+    values = array("d", lookup[0])
+    values.extend(lookup[1])
+    if sys.byteorder == "big":
+        values.byteswap()
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            values.tofile(file)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_hue_to_angle_lookup(
+    image: Image.Image,
+    samples: int = 1024,
+    ring: float = 0.985,
+    key: str | None = None,
+) -> tuple[Sequence[float], Sequence[float]]:
+    """Return the hue lookup for ``image``, reusing a cached table if present.
+
+    ``image``, ``samples`` and ``ring`` are those of
+    :func:`color_utils.build_hue_to_angle_lookup`. ``key`` identifies the
+    image content (for example a digest of the file it was resized from) and
+    saves hashing its pixels; it must change whenever the pixels can change.
+    A missing or unwritable cache directory only disables the cache.
+    """
+
+    path = _cache_path(image, samples, ring, key)
+    lookup = _read(path, samples)
+    if lookup is None:
+        lookup = build_hue_to_angle_lookup(image, samples, ring)
+        _write(path, lookup)
+    return lookup
+
+
+def file_digest(path: str) -> str:
+    """Return a hex digest of the file at ``path``."""
+
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def clear_disk_cache() -> int:
+    """Delete every cached lookup table and return how many were removed."""
+
+    removed = 0
+    try:
+        names = os.listdir(cache_dir())
+    except OSError:
+        return 0
+    for name in names:
+        if name.startswith("hue_lookup-"):
+            try:
+                os.remove(os.path.join(cache_dir(), name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
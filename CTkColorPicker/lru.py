@@ -0,0 +1,85 @@
+"""Bounded least-recently-used cache shared by the process-wide caches."""
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics reported by :meth:`LRUCache.info`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache:
+    """Mapping of at most ``maxsize`` entries that evicts the least recently
+    used one and counts hits, misses and evictions.
+
+    ``None`` cannot be stored, since :meth:`get` returns it for a miss.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache of at most ``maxsize`` entries (at least 1)."""
+
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._maxsize = max(1, int(maxsize))
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        """Number of entries kept; see :meth:`resize`."""
+
+        return self._maxsize
+
+    def get(self, key: Hashable) -> Any:
+        """Return the entry of ``key`` and mark it as recently used, or
+        ``None`` if there is none."""
+
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if the
+        cache is full."""
+
+        self._entries[key] = value
+        self._evict()
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counters."""
+
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, len(self), self.maxsize
+        )
+
+    def resize(self, maxsize: int) -> None:
+        """Change the number of entries kept, evicting the oldest if needed."""
+
+        self._maxsize = max(1, int(maxsize))
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond ``maxsize``."""
+
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
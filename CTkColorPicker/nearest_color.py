@@ -0,0 +1,271 @@
+"""Perceptual nearest-color search over named colors and palettes.
+
+:class:`NearestColorIndex` stores a palette as points in OKLab, bucketed into
+a uniform 3D grid. Each cell remembers the few entries that can be nearest
+to a color inside it, so looking up the name of the picker's color costs a
+few microseconds::
+
+    from CTkColorPicker.nearest_color import css_color_index
+
+    css_color_index().nearest("#fa8070")[0].name  # 'salmon'
+"""
+
+import functools
+import math
+from collections.abc import Mapping
+from heapq import nsmallest
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from .color_utils import normalize_hex
+from .oklab import SRGB_BOUNDS, srgb_to_oklab
+
+
+class Match(NamedTuple):
+    """A palette entry returned by :meth:`NearestColorIndex.nearest`."""
+
+    name: str
+    hex: str
+    distance: float
+    """Euclidean distance in OKLab; about ``0.02`` is a just noticeable
+    difference."""
+
+
+def _parse_rgb(color: Any) -> tuple[int, int, int]:
+    """Return the 0..255 channels of a hex string or an RGB triplet.
+
+    Raises
+    ------
+    ValueError
+        If ``color`` is not a valid color.
+    """
+
+    if isinstance(color, str):
+        normalized = normalize_hex(color)
+        if normalized is None:
+            raise ValueError(f"invalid color: {color!r}")
+        return tuple(int(normalized[i : i + 2], 16) for i in (1, 3, 5))
+    r, g, b = (int(channel) for channel in color)
+    if not all(0 <= channel <= 255 for channel in (r, g, b)):
+        raise ValueError(f"invalid color: {color!r}")
+    return r, g, b
+
+
+CELLS_PER_ENTRY = 16
+"""Grid cells per palette entry; more cells mean shorter candidate lists."""
+
+
+class NearestColorIndex:
+    """Index answering k-nearest queries over a fixed palette.
+
+    Distances are measured in OKLab. The index divides the OKLab box of all
+    sRGB colors into a grid of about :data:`CELLS_PER_ENTRY` cells per entry
+    and buckets the entries by cell. The first query landing in a cell
+    collects, from the surrounding buckets, the entries that can be among
+    the ``k`` nearest of any color in that cell; later queries there only
+    compare against those few candidates.
+    """
+
+    def __init__(
+        self,
+        colors: "Mapping[str, str] | Iterable[str]",
+        cell_size: float | None = None,
+    ) -> None:
+        """Build the index.
+
+        Parameters
+        ----------
+        colors : Mapping[str, str] | Iterable[str]
+            Palette as a mapping of names to hex colors, or hex colors which
+            are then used as their own names.
+        cell_size : float | None
+            Edge length of a grid cell in OKLab units.
+
+        Raises
+        ------
+        ValueError
+            If a color is invalid or the palette is empty.
+        """
+
+        items = (
+            colors.items()
+            if isinstance(colors, Mapping)
+            else ((color, color) for color in colors)
+        )
+        self.names: list[str] = []
+        self.hexes: list[str] = []
+        self.points: list[tuple[float, float, float]] = []
+        for name, color in items:
+            normalized = normalize_hex(color)
+            if normalized is None:
+                raise ValueError(f"invalid color for {name!r}: {color!r}")
+            self.names.append(name)
+            self.hexes.append(normalized)
+            self.points.append(srgb_to_oklab(*_parse_rgb(normalized)))
+        if not self.points:
+            raise ValueError("cannot index an empty palette")
+
+        self.origin = tuple(low for low, _ in SRGB_BOUNDS)
+        extent = [high - low for low, high in SRGB_BOUNDS]
+        if cell_size is None:
+            cells = CELLS_PER_ENTRY * len(self.points)
+            cell_size = (math.prod(extent) / cells) ** (1 / 3)
+        self.cell_size = max(float(cell_size), 1e-3)
+        self.shape = tuple(math.ceil(side / self.cell_size) for side in extent)
+        self._buckets: dict[tuple[int, int, int], list[int]] = {}
+        for index, point in enumerate(self.points):
+            self._buckets.setdefault(self._cell_of(point), []).append(index)
+        self._candidates: dict[tuple[int, int, int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _cell_of(self, point: tuple[float, float, float]) -> tuple[int, int, int]:
+        """Return the grid cell holding ``point``."""
+
+        size, (ox, oy, oz), (sx, sy, sz) = self.cell_size, self.origin, self.shape
+        return (
+            min(max(int((point[0] - ox) / size), 0), sx - 1),
+            min(max(int((point[1] - oy) / size), 0), sy - 1),
+            min(max(int((point[2] - oz) / size), 0), sz - 1),
+        )
+
+    def _ring(self, cell: tuple[int, int, int], radius: int) -> Iterator[int]:
+        """Yield the entries bucketed ``radius`` cells around ``cell``."""
+
+        cx, cy, cz = cell
+        buckets = self._buckets
+        for x in range(cx - radius, cx + radius + 1):
+            for y in range(cy - radius, cy + radius + 1):
+                if abs(x - cx) == radius or abs(y - cy) == radius:
+                    z_values = range(cz - radius, cz + radius + 1)
+                else:
+                    z_values = (cz - radius, cz + radius)
+                for z in z_values:
+                    bucket = buckets.get((x, y, z))
+                    if bucket:
+                        yield from bucket
+
+    def _candidates_in(self, cell: tuple[int, int, int], k: int) -> list[int]:
+        """Return the entries that can be among the ``k`` nearest in ``cell``.
+
+        An entry qualifies unless it is farther from every point of the cell
+        than ``k`` other entries are from all of it. Buckets are scanned in
+        rings around the cell until the remaining ones are out of reach.
+        Computed once per cell and ``k``.
+        """
+
+        key = (*cell, k)
+        found = self._candidates.get(key)
+        if found is not None:
+            return found
+
+        size = self.cell_size
+        low = [origin + index * size for origin, index in zip(self.origin, cell)]
+        high = [value + size for value in low]
+        near: dict[int, float] = {}
+        far: list[float] = []
+        reach_sq = math.inf
+        for radius in range(max(self.shape) + 1):
+            # Entries in ring ``radius`` are at least ``radius - 1`` cells away.
+            gap = (radius - 1) * size
+            if gap > 0 and gap * gap > reach_sq:
+                break
+            for index in self._ring(cell, radius):
+                near_sq = far_sq = 0.0
+                for value, lo, hi in zip(self.points[index], low, high):
+                    below, above = lo - value, value - hi
+                    outside = below if below > 0 else above if above > 0 else 0.0
+                    near_sq += outside * outside
+                    span = max(value - lo, hi - value)
+                    far_sq += span * span
+                near[index] = near_sq
+                far.append(far_sq)
+            if len(far) >= k:
+                reach_sq = nsmallest(k, far)[-1]
+        found = sorted(index for index, near_sq in near.items() if near_sq <= reach_sq)
+        self._candidates[key] = found
+        return found
+
+    def nearest(self, color: Any, k: int = 1) -> list[Match]:
+        """Return the ``k`` palette entries closest to ``color``.
+
+        Parameters
+        ----------
+        color : Any
+            Hex string or ``(r, g, b)`` triplet of 0..255 channels.
+        k : int
+            Number of entries to return, at most the palette size.
+
+        Returns
+        -------
+        list[Match]
+            Entries sorted by increasing distance.
+
+        Raises
+        ------
+        ValueError
+            If ``color`` is invalid.
+        """
+
+        point = srgb_to_oklab(*_parse_rgb(color))
+        k = max(1, min(int(k), len(self.points)))
+        return [
+            Match(self.names[index], self.hexes[index], math.sqrt(distance))
+            for distance, index in self._search(point, k)
+        ]
+
+    def _search(
+        self, point: tuple[float, float, float], k: int
+    ) -> list[tuple[float, int]]:
+        """Return ``(squared distance, index)`` of the ``k`` nearest entries."""
+
+        px, py, pz = point
+        points = self.points
+        distances = []
+        for index in self._candidates_in(self._cell_of(point), k):
+            qx, qy, qz = points[index]
+            distances.append(((qx - px) ** 2 + (qy - py) ** 2 + (qz - pz) ** 2, index))
+        if k == 1:
+            return [min(distances)]
+        return nsmallest(k, distances)
+
+
+def css_colors() -> dict[str, str]:
+    """Return the 148 CSS named colors as a mapping of names to hex strings.
+
+    Pillow caches the colors it has resolved in ``ImageColor.colormap`` as
+    RGB tuples, so those entries are converted back to hex.
+    """
+
+    from PIL import ImageColor
+
+    return {
+        name: value if isinstance(value, str) else "#%02x%02x%02x" % value[:3]
+        for name, value in ImageColor.colormap.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def css_color_index() -> NearestColorIndex:
+    """Return the shared index of the CSS named colors, built on first use."""
+
+    return NearestColorIndex(css_colors())
+
+
+def nearest_color_index(
+    colors: "NearestColorIndex | Mapping[str, str] | Iterable[str] | bool | None",
+) -> NearestColorIndex | None:
+    """Resolve the ``nearest_colors`` option of the pickers.
+
+    ``True`` selects :func:`css_color_index`, ``None`` or ``False`` disable
+    the readout and an index is used as is. Any other value is indexed with
+    :class:`NearestColorIndex`.
+    """
+
+    if colors is None or colors is False:
+        return None
+    if colors is True:
+        return css_color_index()
+    if isinstance(colors, NearestColorIndex):
+        return colors
+    return NearestColorIndex(colors)
@@ -0,0 +1,99 @@
+"""Conversions between sRGB and the perceptual OKLab color space.
+
+OKLab is designed so that Euclidean distances roughly match perceived color
+differences, which makes it suitable for nearest-color searches. See
+https://bottosson.github.io/posts/oklab/ for the definition.
+"""
+
+import math
+from bisect import bisect_right
+
+_LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (i / 255 for i in range(256))
+)
+"""Linear-light value of every 8-bit sRGB channel value."""
+
+SRGB_BOUNDS = ((0.0, 1.0), (-0.24, 0.28), (-0.32, 0.2))
+"""``(low, high)`` ranges of ``L``, ``a`` and ``b`` enclosing every sRGB
+color, rounded outwards."""
+
+
+def _cbrt(value: float) -> float:
+    """Return the real cube root of ``value``."""
+
+    return value ** (1 / 3) if value >= 0 else -((-value) ** (1 / 3))
+
+
+def srgb_to_oklab(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """Convert 0..255 sRGB channels to OKLab ``(L, a, b)``.
+
+    ``L`` lies in 0..1; ``a`` and ``b`` stay within about ±0.4 for sRGB
+    colors.
+    """
+
+    r, g, b = _LINEAR[r], _LINEAR[g], _LINEAR[b]
+    l_ = _cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m_ = _cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s_ = _cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def _encode(value: float) -> int:
+    """Return the 0..255 sRGB channel of a linear-light value, clamped."""
+
+    if value <= 0.0031308:
+        value *= 12.92
+    else:
+        value = 1.055 * value ** (1 / 2.4) - 0.055
+    return min(max(int(value * 255 + 0.5), 0), 255)
+
+
+def _threshold(channel: int) -> float:
+    """Return the smallest linear-light value :func:`_encode` maps to at
+    least ``channel``."""
+
+    encoded = (channel - 0.5) / 255
+    if encoded <= 0.04045:
+        value = encoded / 12.92
+    else:
+        value = ((encoded + 0.055) / 1.055) ** 2.4
+    while _encode(value) >= channel:
+        value = math.nextafter(value, -math.inf)
+    while _encode(value) < channel:
+        value = math.nextafter(value, math.inf)
+    return value
+
+
+ENCODE_THRESHOLDS = tuple(_threshold(channel) for channel in range(1, 256))
+"""Linear-light values at which :func:`_encode` steps up; the number of
+thresholds at or below a value is its encoded channel, so a binary search
+replaces the power function."""
+
+
+def oklab_to_srgb(lightness: float, a: float, b: float) -> tuple[int, int, int]:
+    """Convert OKLab to 0..255 sRGB channels.
+
+    Colors outside the sRGB gamut are clamped per channel.
+    """
+
+    l_ = lightness + 0.3963377774 * a + 0.2158037573 * b
+    m_ = lightness - 0.1055613458 * a - 0.0638541728 * b
+    s_ = lightness - 0.0894841775 * a - 1.2914855480 * b
+    l, m, s = l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_
+    thresholds = ENCODE_THRESHOLDS
+    return (
+        bisect_right(
+            thresholds, 4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s
+        ),
+        bisect_right(
+            thresholds, -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s
+        ),
+        bisect_right(
+            thresholds, -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s
+        ),
+    )
@@ -0,0 +1,344 @@
+"""Perceptual OKLCH color wheel.
+
+On this wheel the polar angle is the OKLCH hue and the distance from the
+center is the chroma relative to the most saturated sRGB color of that hue
+and lightness, so the rim always shows the gamut boundary and no position is
+out of gamut. The brightness slider sets the OKLCH lightness in 256 steps.
+
+The gamut boundary comes from tables:
+
+* :func:`boundary_row` holds the maximum in-gamut chroma at one lightness for
+  :data:`HUE_BINS` hues, and is built when the wheel is rendered at that
+  lightness. :func:`oklch_to_rgb` and :func:`rgb_to_oklch` read it, or solve
+  the two bins they need with the same result, so hex colors round-trip;
+* :class:`OklchWheelIndex`, built per wheel size, holds the quantized hue and
+  relative chroma of every pixel for hit-testing, and the per-pixel
+  conversion inputs used to render the wheel at any lightness.
+"""
+
+import functools
+import math
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from PIL import Image
+
+from .color_utils import TAU
+from .oklab import ENCODE_THRESHOLDS, oklab_to_srgb, srgb_to_oklab
+from .wheel_index import HUE_LEVELS, SAT_LEVELS, WheelIndex
+from .wheel_renderer import DEFAULT_SUPERSAMPLE, _polar_grid, _rim_alpha
+
+LIGHTNESS_LEVELS = 256
+"""Brightness slider steps; step ``v`` stands for the lightness ``v / 255``."""
+
+HUE_BINS = 1440
+"""Hues at which the gamut boundary is solved; values in between are
+interpolated linearly."""
+
+CHROMA_SEARCH_STEPS = 16
+"""Bisection steps used to find the gamut boundary."""
+
+GAMUT_TOLERANCE = 1e-3
+"""Linear-light overshoot still counted as in gamut. Along some hues a
+channel dips a few ten-thousandths below zero and comes back, which would
+otherwise cut the boundary short of in-gamut colors."""
+
+ROW_CACHE_SIZE = 8
+"""Lightness values whose boundary rows are kept."""
+
+MAX_CHROMA = 0.33
+"""Upper bound of the chroma of sRGB colors (the largest is about 0.322)."""
+
+COLOR_CACHE_SIZE = 8
+"""Lightness steps whose per-pixel colors are kept per wheel size."""
+
+DISPLAY_BRIGHTNESS = 191
+"""Slider value whose lightness the unshaded wheel is rendered at."""
+
+
+_LMS_TO_RGB = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+"""Rows converting cubed cone responses to linear-light sRGB."""
+
+
+def _oklab_to_srgb_array(
+    lightness: float, a: "np.ndarray", b: "np.ndarray"
+) -> "np.ndarray":
+    """Vectorized :func:`oklab.oklab_to_srgb`, stacked along a last axis."""
+
+    l_ = lightness + 0.3963377774 * a + 0.2158037573 * b
+    m_ = lightness - 0.1055613458 * a - 0.0638541728 * b
+    s_ = lightness - 0.0894841775 * a - 1.2914855480 * b
+    l, m, s = l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_
+    thresholds = np.array(ENCODE_THRESHOLDS)
+    out = np.empty((*np.shape(a), 3), dtype=np.uint8)
+    for channel, (wl, wm, ws) in enumerate(_LMS_TO_RGB):
+        linear = wl * l + wm * m + ws * s
+        out[..., channel] = np.searchsorted(thresholds, linear, side="right")
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _hue_slopes() -> tuple[list[float], list[float], list[float]]:
+    """Return the change of the three cone responses per unit of chroma at
+    every hue bin.
+
+    Along a hue the cone responses are linear in the chroma. The slopes are
+    computed once and shared by the scalar and the vectorized solvers, so
+    both bisect with identical numbers.
+    """
+
+    hue = [column / HUE_BINS * TAU for column in range(HUE_BINS)]
+    cos, sin = [math.cos(h) for h in hue], [math.sin(h) for h in hue]
+    return (
+        [0.3963377774 * c + 0.2158037573 * s for c, s in zip(cos, sin)],
+        [-0.1055613458 * c - 0.0638541728 * s for c, s in zip(cos, sin)],
+        [-0.0894841775 * c - 1.2914855480 * s for c, s in zip(cos, sin)],
+    )
+
+
+def _solve_boundary(lightness: float, column: int) -> float:
+    """Bisect the largest in-gamut chroma at a lightness and a hue bin."""
+
+    slopes = _hue_slopes()
+    slope_l, slope_m, slope_s = (slope[column] for slope in slopes)
+    low = 0.0
+    step = MAX_CHROMA
+    for _ in range(CHROMA_SEARCH_STEPS):
+        step /= 2
+        middle = low + step
+        l_ = lightness + middle * slope_l
+        m_ = lightness + middle * slope_m
+        s_ = lightness + middle * slope_s
+        l, m, s = l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_
+        for wl, wm, ws in _LMS_TO_RGB:
+            channel = wl * l + wm * m + ws * s
+            if not -GAMUT_TOLERANCE <= channel <= 1 + GAMUT_TOLERANCE:
+                break
+        else:
+            low = middle
+    return low
+
+
+_rows: "OrderedDict[float, list[float]]" = OrderedDict()
+
+
+def boundary_row(lightness: float) -> list[float]:
+    """Return the largest in-gamut chroma at an OKLCH lightness for every
+    hue bin, with the first bin repeated at the end.
+
+    Solved with NumPy by the same bisection as :func:`_solve_boundary`, so
+    every entry equals the scalar result. Building a row takes about a
+    millisecond; the wheel builds one per slider step it renders, and picks
+    at that lightness read it. The :data:`ROW_CACHE_SIZE` most recent rows
+    are kept.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    row = _rows.get(lightness)
+    if row is not None:
+        _rows.move_to_end(lightness)
+        return row
+    if np is None:
+        raise ImportError("the OKLCH wheel requires NumPy")
+
+    slopes = [np.array(slope) for slope in _hue_slopes()]
+    low = np.zeros(HUE_BINS)
+    step = MAX_CHROMA
+    for _ in range(CHROMA_SEARCH_STEPS):
+        step /= 2
+        middle = low + step
+        l_, m_, s_ = (lightness + middle * slope for slope in slopes)
+        l, m, s = l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_
+        inside = np.ones(HUE_BINS, dtype=bool)
+        for wl, wm, ws in _LMS_TO_RGB:
+            channel = wl * l + wm * m + ws * s
+            inside &= (channel >= -GAMUT_TOLERANCE) & (channel <= 1 + GAMUT_TOLERANCE)
+        low = np.where(inside, middle, low)
+    row = low.tolist()
+    row.append(row[0])
+    _rows[lightness] = row
+    while len(_rows) > ROW_CACHE_SIZE:
+        _rows.popitem(last=False)
+    return row
+
+
+def _bin_position(hue: float) -> tuple[int, float]:
+    """Return the hue bin at or below a 0..1 hue and the fraction towards
+    the next one."""
+
+    position = (hue % 1.0) * HUE_BINS
+    column = min(int(position), HUE_BINS - 1)
+    return column, position - column
+
+
+def boundary_chroma(lightness: float, hue: float) -> float:
+    """Return the largest in-gamut chroma at an OKLCH lightness and a 0..1
+    hue, interpolated between the two nearest hue bins.
+
+    Read from :func:`boundary_row` if the row of ``lightness`` was built;
+    otherwise only the two bins are solved, with the same result.
+    """
+
+    column, fraction = _bin_position(hue)
+    row = _rows.get(lightness)
+    if row is None:
+        low = _solve_boundary(lightness, column)
+        high = _solve_boundary(lightness, (column + 1) % HUE_BINS)
+    else:
+        low, high = row[column], row[column + 1]
+    return low + (high - low) * fraction
+
+
+def oklch_to_rgb(
+    hue: float, relative_chroma: float, lightness: float
+) -> tuple[int, int, int]:
+    """Return the color at a wheel hue (0..1), relative chroma (0..1) and
+    OKLCH lightness (0..1).
+
+    The boundary comes from :func:`boundary_chroma`, which reads the row
+    the wheel is rendered from. A slider value ``v`` stands for the lightness
+    ``v / 255``.
+    """
+
+    chroma = relative_chroma * boundary_chroma(lightness, hue)
+    angle = hue * TAU
+    return oklab_to_srgb(lightness, chroma * math.cos(angle), chroma * math.sin(angle))
+
+
+def rgb_to_oklch(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """Return the wheel hue (0..1), relative chroma (0..1) and OKLCH
+    lightness (0..1) of a color.
+
+    The inverse of :func:`oklch_to_rgb`, measured against the same
+    interpolated boundary. Colors a little beyond it near the rim are
+    clamped to relative chroma ``1``. Grays get hue ``0``.
+    """
+
+    lightness, a, b_ = srgb_to_oklab(r, g, b)
+    lightness = min(max(lightness, 0.0), 1.0)
+    chroma = math.hypot(a, b_)
+    if chroma < 1e-7:
+        return 0.0, 0.0, lightness
+    hue = (math.atan2(b_, a) / TAU) % 1.0
+    boundary = boundary_chroma(lightness, hue)
+    relative = min(chroma / boundary, 1.0) if boundary > 0 else 0.0
+    return hue, relative, lightness
+
+
+class OklchWheelIndex(WheelIndex):
+    """:class:`WheelIndex` of an OKLCH wheel.
+
+    ``hue`` holds the OKLCH hue and ``sat`` the relative chroma of every
+    pixel. Colors depend on the lightness through the gamut boundary:
+    :meth:`render` converts the whole wheel, keeping the colors of the
+    :data:`COLOR_CACHE_SIZE` most recent lightness steps, and picks read
+    them. Picks at other lightness steps convert the one picked color with
+    :func:`oklch_to_rgb`, from the same :func:`boundary_row` and the same
+    quantized hue and chroma.
+    """
+
+    def __init__(self, size: int, hue: array, sat: array, supersample: int) -> None:
+        """Wrap prebuilt tables; use :func:`build_oklch_index`."""
+
+        super().__init__(size, hue, sat)
+        self.supersample = supersample
+        self._inputs: tuple | None = None
+        self._alpha: "np.ndarray | None" = None
+        self._colors: "OrderedDict[int, bytes]" = OrderedDict()
+
+    def colors(self, brightness: int) -> bytes:
+        """Return the packed RGB colors of every pixel at a 0..255 slider
+        value, as rendered."""
+
+        colors = self._colors.get(brightness)
+        if colors is not None:
+            self._colors.move_to_end(brightness)
+            return colors
+
+        if self._inputs is None:
+            hue = np.frombuffer(self.hue, dtype=np.uint16) / HUE_LEVELS
+            relative = np.frombuffer(self.sat, dtype=np.uint16) / SAT_LEVELS
+            position = hue * HUE_BINS
+            column = np.minimum(position.astype(np.int64), HUE_BINS - 1)
+            angle = hue * TAU
+            self._inputs = (
+                relative,
+                column,
+                position - column,
+                np.cos(angle),
+                np.sin(angle),
+            )
+        relative, column, fraction, cos, sin = self._inputs
+        lightness = brightness / (LIGHTNESS_LEVELS - 1)
+        row = np.array(boundary_row(lightness))
+        low = row[column]
+        chroma = relative * (low + (row[column + 1] - low) * fraction)
+        colors = _oklab_to_srgb_array(lightness, chroma * cos, chroma * sin).tobytes()
+        self._colors[brightness] = colors
+        while len(self._colors) > COLOR_CACHE_SIZE:
+            self._colors.popitem(last=False)
+        return colors
+
+    def rgb(self, x: float, y: float, brightness: int) -> tuple[int, int, int]:
+        """Return the integer RGB color at ``(x, y)`` for a 0..255 brightness.
+
+        Read from the rendered colors if the wheel was rendered at
+        ``brightness``, converted with :func:`oklch_to_rgb` otherwise.
+        """
+
+        colors = self._colors.get(brightness)
+        if colors is None:
+            hue, relative = self.hue_sat(x, y)
+            return oklch_to_rgb(hue, relative, brightness / (LIGHTNESS_LEVELS - 1))
+        i = self.pixel(x, y) * 3
+        return colors[i], colors[i + 1], colors[i + 2]
+
+    def render(self, brightness: int) -> Image.Image:
+        """Rasterize the RGBA wheel at the lightness of a 0..255 slider value."""
+
+        if self._alpha is None:
+            self._alpha = _rim_alpha(self.size, self.supersample)
+        pixels = np.empty((self.size, self.size, 4), dtype=np.uint8)
+        pixels[..., :3] = np.frombuffer(
+            self.colors(brightness), dtype=np.uint8
+        ).reshape(self.size, self.size, 3)
+        pixels[..., 3] = self._alpha
+        return Image.fromarray(pixels, "RGBA")
+
+
+def build_oklch_index(
+    size: int, supersample: int = DEFAULT_SUPERSAMPLE
+) -> OklchWheelIndex:
+    """Build the index of a ``size`` pixel OKLCH wheel.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    if np is None:
+        raise ImportError("the OKLCH wheel requires NumPy")
+
+    angle, chroma = _polar_grid(size)
+    hue_q = np.rint(angle / TAU * HUE_LEVELS).astype(np.int64) % HUE_LEVELS
+    chroma_q = np.rint(chroma * SAT_LEVELS)
+    return OklchWheelIndex(
+        size,
+        array("H", hue_q.astype(np.uint16).tobytes()),
+        array("H", chroma_q.astype(np.uint16).tobytes()),
+        supersample,
+    )
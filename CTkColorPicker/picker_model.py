@@ -0,0 +1,404 @@
+"""Tk-free color state shared by :class:`AskColor` and :class:`CTkColorPicker`."""
+
+import math
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+from .color_utils import (
+    TAU,
+    hsv_to_rgb,
+    hue_to_angle,
+    normalize_hex,
+    projection_on_circle,
+    readable_text_color,
+    rgb_to_hsv,
+    wheel_hue_sat,
+)
+from .lru import CacheInfo, LRUCache
+
+if TYPE_CHECKING:
+    from .wheel_index import WheelIndex
+
+DEFAULT_PLACEMENT_CACHE_SIZE = 512
+"""Number of hex colors whose wheel placement is kept."""
+
+COLOR_SPACES = ("hsv", "oklch")
+"""Accepted values of the ``color_space`` option."""
+
+
+class Placement(NamedTuple):
+    """Precomputed data for selecting a hex color on one wheel geometry.
+
+    ``hsv`` holds the wheel coordinates: hue, saturation and value on an HSV
+    wheel; hue, relative chroma and lightness on an OKLCH wheel. ``alpha``
+    is ``None`` unless the color was given as ``#rgba`` or ``#rrggbbaa``.
+    """
+
+    hex: str
+    rgb: tuple[int, int, int]
+    hsv: tuple[float, float, float]
+    x: float
+    y: float
+    alpha: int | None = None
+
+
+# Entries keep the hue lookup they were computed with, so the ``id`` in the
+# key cannot be reused by another lookup while the entry exists.
+_placements = LRUCache(DEFAULT_PLACEMENT_CACHE_SIZE)
+
+
+def placement(
+    value: str | None,
+    size: int,
+    hue_lookup: tuple[Sequence[float], Sequence[float]] | None = None,
+    color_space: str = "hsv",
+) -> Placement | None:
+    """Return where ``value`` lies on a ``size`` pixel wheel.
+
+    Results are kept in a process-wide LRU cache shared by all pickers and
+    keyed by the color string as given, the wheel size, the hue lookup and
+    the color space, so a hit skips normalization too and a different
+    geometry or lookup never sees stale positions.
+
+    Parameters
+    ----------
+    value : str | None
+        Hex color in any form accepted by :func:`normalize_hex`, alpha
+        included.
+    size : int
+        Side length of the wheel in pixels.
+    hue_lookup : tuple[Sequence[float], Sequence[float]] | None
+        Hue lookup of an image wheel, ``None`` for a procedural wheel.
+    color_space : str
+        ``"hsv"`` or ``"oklch"``, see :class:`PickerModel`.
+
+    Returns
+    -------
+    Placement | None
+        The placement, or ``None`` if ``value`` is not a valid hex color.
+    """
+
+    key = (value, size, id(hue_lookup), color_space)
+    entry = _placements.get(key)
+    if entry is not None:
+        return entry[1]
+
+    normalized = normalize_hex(value, allow_alpha=True)
+    if normalized is None:
+        return None
+    alpha = int(normalized[7:], 16) if len(normalized) == 9 else None
+    normalized = normalized[:7]
+    r, g, b = (int(normalized[i : i + 2], 16) for i in (1, 3, 5))
+    if color_space == "oklch":
+        from .oklch_wheel import rgb_to_oklch
+
+        h, s, v = rgb_to_oklch(r, g, b)
+        angle = h * TAU
+    else:
+        h, s, v = rgb_to_hsv(r, g, b)
+        try:
+            angle = hue_to_angle(h, hue_lookup)
+        except Exception:
+            angle = (h * TAU) % TAU  # safety fallback
+
+    c = size / 2
+    radius = s * (c - 1)
+    result = Placement(
+        normalized,
+        (r, g, b),
+        (h, s, v),
+        c + radius * math.cos(angle),
+        c - radius * math.sin(angle),
+        alpha,
+    )
+    _placements.put(key, (hue_lookup, result))
+    return result
+
+
+def placement_cache_info() -> CacheInfo:
+    """Return hit, miss and eviction counters of the placement cache."""
+
+    return _placements.info()
+
+
+def set_placement_cache_size(maxsize: int) -> None:
+    """Change the number of placements kept, evicting the oldest if needed."""
+
+    _placements.resize(maxsize)
+
+
+def clear_placement_cache() -> None:
+    """Drop every cached placement and reset the statistics."""
+
+    _placements.clear()
+
+
+class PickerModel:
+    """Hue, saturation and brightness of a color wheel selection.
+
+    The model owns the target position on a ``size`` x ``size`` wheel and
+    converts between positions and colors. It touches no widgets, so it can
+    be driven and benchmarked without a display; the picker widgets only
+    render its state.
+
+    In the ``"oklch"`` color space the wheel angle is the OKLCH hue, the
+    radius the chroma relative to the sRGB gamut boundary and the slider the
+    lightness, see :mod:`oklch_wheel`.
+
+    HSV colors are computed from the target position. On the OKLCH wheel the
+    precomputed ``index`` serves targets on whole pixels inside the disc,
+    which is where drags land. Targets placed by :meth:`set_hex`,
+    projected onto the rim or scaled by :meth:`resize` keep their exact hue
+    and saturation, so changing the brightness there does not snap the color
+    to the nearest pixel. On the OKLCH wheel a color from :meth:`set_hex`
+    also keeps its exact lightness until the slider moves or a drag picks a
+    pixel, whose color is the one rendered there.
+
+    Attributes
+    ----------
+    x, y : float
+        Target position in wheel pixels.
+    hue, saturation : float
+        Hue and saturation (0..1) at the target; OKLCH hue and relative
+        chroma in the ``"oklch"`` color space.
+    brightness : int
+        Brightness slider value, 0..255: HSV value or OKLCH lightness.
+    alpha : int
+        Opacity, 0..255; stays ``255`` unless the model was created
+        ``with_alpha``.
+    rgb : tuple[int, int, int]
+        Selected color.
+    hex : str
+        Selected color as ``#rrggbb``.
+    text_color : str
+        ``"white"`` or ``"black"``, whichever reads better on ``hex``.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        hue_lookup: tuple[Sequence[float], Sequence[float]] | None = None,
+        index: "WheelIndex | None" = None,
+        color_space: str = "hsv",
+        with_alpha: bool = False,
+    ) -> None:
+        """Create a model for a wheel of ``size`` pixels.
+
+        Parameters
+        ----------
+        size : int
+            Side length of the wheel in pixels.
+        hue_lookup : tuple[Sequence[float], Sequence[float]] | None
+            Hue lookup of an image wheel, ``None`` for a procedural wheel.
+        index : WheelIndex | None
+            Per-pixel index of the OKLCH wheel, built on demand if not
+            given. HSV wheels have none.
+        color_space : str
+            ``"hsv"`` for the classic wheel or ``"oklch"`` for the
+            perceptual one.
+        with_alpha : bool
+            Accept ``#rgba`` and ``#rrggbbaa`` colors in :meth:`set_hex`.
+
+        Raises
+        ------
+        ValueError
+            If ``color_space`` is not one of :data:`COLOR_SPACES`.
+        ImportError
+            If ``color_space`` is ``"oklch"`` and NumPy is not installed.
+        """
+
+        if color_space not in COLOR_SPACES:
+            raise ValueError(
+                f"color_space must be one of {', '.join(COLOR_SPACES)}, "
+                f"got {color_space!r}"
+            )
+        if color_space == "oklch" and index is None:
+            from .oklch_wheel import build_oklch_index
+
+            index = build_oklch_index(size)
+        self.size = size
+        self.hue_lookup = hue_lookup
+        self.index = index
+        self.color_space = color_space
+        self.with_alpha = with_alpha
+        self.x = self.y = size / 2
+        self.hue = 0.0
+        self.saturation = 0.0
+        self._exact = True
+        self._lightness: float | None = None
+        self.brightness = 255
+        self.alpha = 255
+        self.rgb = (255, 255, 255)
+        self.hex = "#ffffff"
+        self.text_color = "black"
+
+    @property
+    def center(self) -> float:
+        """Coordinate of the wheel center on both axes."""
+
+        return self.size / 2
+
+    @property
+    def radius(self) -> float:
+        """Radius of the selectable disc."""
+
+        return self.size / 2 - 1
+
+    @property
+    def hex_alpha(self) -> str:
+        """Selected color as ``#rrggbbaa``."""
+
+        return f"{self.hex}{self.alpha:02x}"
+
+    def clamp(self, x: float, y: float) -> tuple[float, float]:
+        """Return ``(x, y)``, projected onto the rim if it is off the wheel."""
+
+        if self.index is not None:
+            return self.index.clamp(x, y)
+        c = self.center
+        if math.hypot(c - x, c - y) < c:
+            return x, y
+        return projection_on_circle(x, y, c, c, self.radius)
+
+    def move_to(self, x: float, y: float) -> str:
+        """Move the target to ``(x, y)`` and return the new hex color.
+
+        The color is unchanged if the target does not move.
+        """
+
+        if (x, y) == (self.x, self.y):
+            return self.hex
+        cx, cy = self.clamp(x, y)
+        if (cx, cy) == (self.x, self.y):
+            return self.hex
+        self.x, self.y = cx, cy
+        on_grid = (cx, cy) == (x, y) and cx == int(cx) and cy == int(cy)
+        if self.index is not None and on_grid:
+            self.hue, self.saturation = self.index.hue_sat(cx, cy)
+            self._exact = False
+            self._lightness = None
+        else:
+            self.hue, self.saturation = wheel_hue_sat(
+                self.size, self.size, cx, cy, self.hue_lookup
+            )
+            self._exact = True
+        self._update_color()
+        return self.hex
+
+    def set_brightness(self, brightness: int) -> str:
+        """Set the 0..255 brightness and return the new hex color."""
+
+        brightness = int(brightness)
+        if brightness == self.brightness:
+            return self.hex
+        self.brightness = brightness
+        self._lightness = None
+        self._update_color()
+        return self.hex
+
+    def set_alpha(self, alpha: int) -> str:
+        """Set the 0..255 opacity and return the color as ``#rrggbbaa``."""
+
+        self.alpha = min(max(int(alpha), 0), 255)
+        return self.hex_alpha
+
+    def set_hex(self, value: str | None) -> bool:
+        """Select ``value`` if it is a valid hex color.
+
+        The target is placed where the color's hue and saturation (or
+        relative chroma) lie on the wheel and the brightness follows its HSV
+        value (or OKLCH lightness), while ``rgb`` and
+        ``hex`` keep the exact input color. Placements come from the shared
+        cache of :func:`placement`. On a model created ``with_alpha`` the
+        opacity follows the color's alpha, ``255`` if it has none.
+
+        Returns
+        -------
+        bool
+            ``False`` if ``value`` is not a valid hex color, in which case
+            the state is unchanged.
+        """
+
+        result = placement(value, self.size, self.hue_lookup, self.color_space)
+        if result is None or (result.alpha is not None and not self.with_alpha):
+            return False
+
+        h, s, v = result.hsv
+        self.x, self.y = result.x, result.y
+        self.hue, self.saturation = h, s
+        self._exact = True
+        if self.color_space == "oklch":
+            self.brightness = round(v * 255)
+            self._lightness = v
+        else:
+            self.brightness = int(v * 255)
+        self.rgb = result.rgb
+        self.hex = result.hex
+        self.text_color = readable_text_color(*result.rgb)
+        if self.with_alpha:
+            self.alpha = 255 if result.alpha is None else result.alpha
+        return True
+
+    def resize(
+        self,
+        size: int,
+        hue_lookup: tuple[Sequence[float], Sequence[float]] | None = None,
+        index: "WheelIndex | None" = None,
+    ) -> None:
+        """Move the model to a wheel of ``size`` pixels, keeping the color.
+
+        The target is scaled about the wheel center, so it keeps its hue and
+        relative distance from the center; ``rgb`` and ``hex`` are unchanged.
+
+        Parameters
+        ----------
+        size : int
+            Side length of the new wheel in pixels.
+        hue_lookup : tuple[Sequence[float], Sequence[float]] | None
+            Hue lookup of the new wheel, ``None`` for a procedural wheel.
+        index : WheelIndex | None
+            Index of the new wheel; built on demand in the ``"oklch"`` color
+            space.
+        """
+
+        if self.color_space == "oklch" and index is None:
+            from .oklch_wheel import build_oklch_index
+
+            index = build_oklch_index(size)
+        old_center, old_radius = self.center, self.radius
+        self.size = size
+        self.hue_lookup = hue_lookup
+        self.index = index
+        scale = self.radius / old_radius if old_radius > 0 else 0.0
+        c = self.center
+        self.x, self.y = self.clamp(
+            c + (self.x - old_center) * scale, c + (self.y - old_center) * scale
+        )
+        self._exact = True
+
+    def reset_position(self) -> None:
+        """Move the target back to the center without changing the color."""
+
+        self.x = self.y = self.center
+        self.hue = self.saturation = 0.0
+        self._exact = True
+
+    def _update_color(self) -> None:
+        """Recompute the color from the hue, saturation and brightness."""
+
+        if self.color_space == "oklch":
+            from .oklch_wheel import oklch_to_rgb
+
+            if not self._exact:
+                self.rgb = self.index.rgb(self.x, self.y, self.brightness)
+            else:
+                lightness = self._lightness
+                if lightness is None:
+                    lightness = self.brightness / 255
+                self.rgb = oklch_to_rgb(self.hue, self.saturation, lightness)
+        else:
+            self.rgb = hsv_to_rgb(self.hue, self.saturation, self.brightness / 255)
+        self.hex = "#{:02x}{:02x}{:02x}".format(*self.rgb)
+        if self.color_space == "oklch":
+            self.text_color = readable_text_color(*self.rgb)
+        else:
+            self.text_color = "white" if self.brightness < 70 else "black"
@@ -0,0 +1,309 @@
+"""Wheel, target and swatch rendering shared by :class:`AskColor` and
+:class:`CTkColorPicker`.
+
+:class:`PickerModel` holds the color; :class:`WheelViewMixin` shows it on the
+canvas, the slider, the entry and the swatch, and keeps the wheel sized to
+the scaling and, for resizable pickers, to the canvas. The pickers keep
+only their layout and how they report colors.
+"""
+
+import tkinter
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image, ImageTk
+
+from .checkerboard import SWATCH_HEIGHT, checkerboard_preview
+from .color_utils import configure_changed, set_entry_text
+from .instrumentation import stopwatch
+from .wheel_assets import (
+    MIN_WHEEL_SIZE,
+    PREVIEW_RESOLUTION,
+    get_wheel_assets,
+    shaded_wheel_image,
+)
+
+if TYPE_CHECKING:
+    from .eyedropper import Eyedropper
+
+TARGET_SIZE = 20
+"""Side length of the target marker before scaling."""
+
+
+class WheelViewMixin:
+    """Canvas and entry rendering of a :class:`PickerModel`.
+
+    Mixed into a customtkinter widget, before the widget class. The widget
+    creates ``model``, ``canvas`` with ``_wheel_item`` and ``_target_item``,
+    ``slider``, ``entry``, the optional ``swatch``, ``alpha_slider`` and
+    ``nearest_label``, and the ``_resize_scheduler`` and
+    ``_resize_debouncer`` that feed :meth:`_preview_resize` and
+    :meth:`_fit_wheel`. It also provides the scaling: ``_scaled(value)``
+    returns ``value`` in pixels at its current scaling and ``_scaling()``
+    the factor the wheel is rasterized at.
+    """
+
+    def _with_alpha(self, hex_color: str) -> str:
+        """Append the model's alpha to ``hex_color`` if the picker has an
+        alpha slider."""
+
+        if not self.model.with_alpha:
+            return hex_color
+        return f"{hex_color}{self.model.alpha:02x}"
+
+    def _update_wheel_shade(self) -> None:
+        """Darken the wheel to the current brightness if it changed.
+
+        The shared wheel image is never modified: the first darker value
+        gives this picker its own photo image, which is then updated in place.
+        """
+
+        brightness = self.brightness_slider_value.get()
+        if not self._shade_wheel or brightness == self._wheel_brightness:
+            return
+        self._wheel_brightness = brightness
+        image = shaded_wheel_image(self._assets, brightness)
+        if self._shaded_wheel is None:
+            self._shaded_wheel = ImageTk.PhotoImage(image, master=self)
+            self.canvas.itemconfigure(self._wheel_item, image=self._shaded_wheel)
+        else:
+            self._shaded_wheel.paste(image)
+
+    def _set_scaling(
+        self, new_widget_scaling: float, new_window_scaling: float
+    ) -> None:
+        """Re-rasterize the wheel for a new scaling.
+
+        customtkinter calls this after ``set_widget_scaling`` or
+        ``set_window_scaling``, or when the window moves to a monitor with
+        another DPI.
+        """
+
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        if not hasattr(self, "model"):
+            return
+        if self._resizable:
+            if self._laid_out:
+                self._fit_wheel(self.canvas.winfo_width(), self.canvas.winfo_height())
+        else:
+            self._set_wheel_size(
+                self._scaled(self._picker_width - 100),
+                self._scaled(TARGET_SIZE),
+                self._scaling(),
+            )
+
+    def _set_wheel_size(
+        self, image_dimension: int, target_dimension: int, scaling: float
+    ) -> None:
+        """Swap in the wheel, target and tables of another size.
+
+        The canvas items keep their identity and only get new images, and
+        the model keeps the color and its place on the wheel. Assets come
+        from the shared cache of :func:`get_wheel_assets`, which is keyed by
+        the scaling too, so switching back to a previous scaling reuses the
+        images, the tables and the shaded wheels built for it.
+        """
+
+        if (image_dimension, target_dimension) == (
+            self.image_dimension,
+            self.target_dimension,
+        ):
+            return
+        watch = stopwatch("rescale")
+        assets = get_wheel_assets(
+            self,
+            image_dimension,
+            target_dimension,
+            scaling,
+            color_space=self.model.color_space,
+        )
+        watch.lap("assets")
+        self._assets = assets
+        self.image_dimension = image_dimension
+        self.target_dimension = target_dimension
+        self.model.resize(image_dimension, assets.hue_lookup, assets.index)
+        self.img1 = assets.wheel_image
+        self.wheel = assets.wheel
+        self.img2 = assets.target_image
+        self.target = assets.target
+
+        if not self._resizable:
+            self.canvas.configure(width=image_dimension, height=image_dimension)
+        self.canvas.itemconfigure(self._wheel_item, image=self.wheel)
+        self.canvas.itemconfigure(self._target_item, image=self.target)
+        self._shaded_wheel = None
+        self._wheel_brightness = assets.base_brightness
+        self._update_wheel_shade()
+        self._place_wheel()
+        if self.swatch is not None:
+            self._swatch_size = (image_dimension, int(SWATCH_HEIGHT * scaling))
+            self.swatch.configure(
+                width=self._swatch_size[0], height=self._swatch_size[1]
+            )
+            self._swatch_image = ImageTk.PhotoImage(
+                "RGB", self._swatch_size, master=self
+            )
+            self.swatch.itemconfigure(self._swatch_item, image=self._swatch_image)
+            self._swatch_color = None
+            self._update_swatch()
+        watch.stop("render")
+
+    def _on_canvas_configure(self, event: tkinter.Event) -> None:
+        """Fit the wheel to the canvas of a resizable picker.
+
+        The first layout, and changes that keep the wheel size, apply right
+        away. During a live resize the wheel is stretched from a
+        low-resolution copy at most ``max_update_rate`` times per second,
+        and the full-quality wheel and its tables are built once, for the
+        final size, after the geometry has settled for
+        :data:`DEFAULT_RESIZE_DELAY` ms.
+        """
+
+        width, height = event.width, event.height
+        size = self._wheel_size_for(width, height)
+        if not self._laid_out or (
+            size == self.image_dimension and self._preview_item is None
+        ):
+            self._laid_out = True
+            self._fit_wheel(width, height)
+            return
+        self._resize_scheduler.submit(width, height)
+        self._resize_debouncer.submit(width, height)
+
+    def _wheel_size_for(self, width: int, height: int) -> int:
+        """Return the largest wheel fitting a ``width`` x ``height`` canvas."""
+
+        return max(min(width, height), self._scaled(MIN_WHEEL_SIZE))
+
+    def _center_wheel(self, width: int, height: int, size: int) -> None:
+        """Center a ``size`` pixel wheel in a ``width`` x ``height`` canvas."""
+
+        self._origin_x = max((width - size) // 2, 0)
+        self._origin_y = max((height - size) // 2, 0)
+
+    def _fit_wheel(self, width: int, height: int) -> None:
+        """End any preview and show the full-quality wheel at the largest
+        size fitting a ``width`` x ``height`` canvas."""
+
+        self._end_preview()
+        size = self._wheel_size_for(width, height)
+        self._center_wheel(width, height, size)
+        self._set_wheel_size(size, self._scaled(TARGET_SIZE), self._scaling())
+        self._place_wheel()
+
+    def _preview_resize(self, width: int, height: int) -> None:
+        """Show the wheel stretched from a low-resolution copy.
+
+        The copy is made once per resize from the wheel on screen; the model
+        and its tables keep the old size until :meth:`_fit_wheel`.
+        """
+
+        size = self._wheel_size_for(width, height)
+        self._center_wheel(width, height, size)
+        if self._preview_item is None:
+            image = shaded_wheel_image(self._assets, self._wheel_brightness)
+            self._preview_source = image.resize(
+                (PREVIEW_RESOLUTION, PREVIEW_RESOLUTION), Image.Resampling.BILINEAR
+            )
+            self._preview_item = self.canvas.create_image(0, 0)
+            self.canvas.tag_lower(self._preview_item, self._target_item)
+            self.canvas.itemconfigure(self._wheel_item, state="hidden")
+        self._preview_photo = ImageTk.PhotoImage(
+            self._preview_source.resize((size, size), Image.Resampling.BILINEAR),
+            master=self,
+        )
+        self.canvas.itemconfigure(self._preview_item, image=self._preview_photo)
+        center = size / 2
+        self.canvas.coords(
+            self._preview_item, self._origin_x + center, self._origin_y + center
+        )
+        model = self.model
+        scale = (center - 1) / model.radius
+        self.canvas.coords(
+            self._target_item,
+            self._origin_x + center + (model.x - model.center) * scale,
+            self._origin_y + center + (model.y - model.center) * scale,
+        )
+
+    def _end_preview(self) -> None:
+        """Drop the resize preview and show the wheel item again."""
+
+        self._resize_scheduler.cancel()
+        self._resize_debouncer.cancel()
+        if self._preview_item is not None:
+            self.canvas.delete(self._preview_item)
+            self.canvas.itemconfigure(self._wheel_item, state="normal")
+            self._preview_item = None
+        self._preview_photo = self._preview_source = None
+
+    def _place_wheel(self) -> None:
+        """Move the wheel and target items to the current origin."""
+
+        center = self.image_dimension / 2
+        self.canvas.coords(
+            self._wheel_item, self._origin_x + center, self._origin_y + center
+        )
+        self._move_target()
+
+    def _move_target(self) -> None:
+        """Move the existing target item to the model's position."""
+
+        self.target_x, self.target_y = self.model.x, self.model.y
+        self.canvas.coords(
+            self._target_item,
+            self._origin_x + self.target_x,
+            self._origin_y + self.target_y,
+        )
+
+    def _show_color(self) -> None:
+        """Show the model's color in the slider, entry, swatch and nearest
+        match."""
+
+        model = self.model
+        self.rgb_color = list(model.rgb)
+        self.default_hex_color = model.hex
+        configure_changed(self.slider, progress_color=model.hex)
+        set_entry_text(self.entry, self._with_alpha(model.hex))
+        configure_changed(self.entry, fg_color=model.hex, text_color=model.text_color)
+        if self._swatch_image is not None:
+            self._update_swatch()
+        if self.nearest_label is not None:
+            match = self._nearest.nearest(model.rgb)[0]
+            text = match.name if match.distance < 1e-6 else f"\u2248 {match.name}"
+            configure_changed(self.nearest_label, text=text)
+
+    def _update_swatch(self) -> None:
+        """Show the color over the checkerboard if it changed.
+
+        Previews come from the cache of :func:`checkerboard_preview` and are
+        pasted into this picker's photo image in place.
+        """
+
+        color = (self.model.rgb, self.model.alpha)
+        if color == self._swatch_color:
+            return
+        self._swatch_color = color
+        self._swatch_image.paste(checkerboard_preview(self._swatch_size, *color))
+
+    def _show_model(self) -> None:
+        """Show a color set on the model: brightness, wheel, target and entry."""
+
+        self.brightness_slider_value.set(self.model.brightness)
+        if self.alpha_slider is not None:
+            self.alpha_slider_value.set(self.model.alpha)
+        self._update_wheel_shade()
+        self._move_target()
+        self.default_rgb = list(self.model.rgb)
+        self._show_color()
+
+    def pick_from_screen(self, **options: Any) -> "Eyedropper":
+        """Start an eyedropper that applies the color clicked on screen.
+
+        Escape or the right mouse button cancel it. ``options`` are passed
+        to :class:`~CTkColorPicker.eyedropper.Eyedropper`.
+        """
+
+        from .eyedropper import Eyedropper
+
+        eyedropper = Eyedropper(self, **options)
+        eyedropper.start()
+        return eyedropper
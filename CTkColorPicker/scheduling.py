@@ -0,0 +1,349 @@
+"""Event coalescing helpers that keep the Tk main loop responsive."""
+
+import time
+from typing import Any, Callable
+
+DEFAULT_MAX_UPDATE_RATE = 60
+"""Default number of color updates per second while dragging."""
+
+DEFAULT_RESIZE_DELAY = 150
+"""Milliseconds a resized picker waits for the geometry to settle before
+rendering the wheel at full quality."""
+
+
+class LatestWinsScheduler:
+    """Run a callback at most ``max_rate`` times per second.
+
+    Every :meth:`submit` replaces the pending arguments, so only the most
+    recent input is processed once the next frame is due. Work is scheduled
+    with ``after_idle`` when a frame is already due and ``after`` otherwise.
+    """
+
+    def __init__(
+        self,
+        widget: Any,
+        callback: Callable[..., None],
+        max_rate: float | None = DEFAULT_MAX_UPDATE_RATE,
+    ) -> None:
+        """Create a scheduler.
+
+        Parameters
+        ----------
+        widget : Any
+            Tk widget used to schedule the callback.
+        callback : Callable[..., None]
+            Function called with the latest submitted arguments.
+        max_rate : float | None
+            Maximum calls per second. ``None`` or ``0`` runs every submission
+            synchronously.
+        """
+
+        self._widget = widget
+        self._callback = callback
+        self._interval = 1 / max_rate if max_rate else 0.0
+        self._pending: tuple[Any, ...] | None = None
+        self._after_id: str | None = None
+        self._last_run = 0.0
+
+    @property
+    def max_rate(self) -> float | None:
+        """Maximum number of callback runs per second, ``None`` if unlimited."""
+
+        return 1 / self._interval if self._interval else None
+
+    @max_rate.setter
+    def max_rate(self, value: float | None) -> None:
+        self._interval = 1 / value if value else 0.0
+
+    def submit(self, *args: Any) -> None:
+        """Queue ``args`` for the next frame, replacing any pending input."""
+
+        self._pending = args
+        if not self._interval:
+            self.flush()
+            return
+        if self._after_id is not None:
+            return
+        delay = self._last_run + self._interval - time.perf_counter()
+        if delay <= 0:
+            self._after_id = self._widget.after_idle(self._run)
+        else:
+            self._after_id = self._widget.after(int(delay * 1000) + 1, self._run)
+
+    def flush(self) -> None:
+        """Process the pending input immediately, if there is any."""
+
+        self._cancel_timer()
+        self._run()
+
+    def cancel(self) -> None:
+        """Drop the pending input without processing it."""
+
+        self._cancel_timer()
+        self._pending = None
+
+    def _cancel_timer(self) -> None:
+        """Cancel the scheduled frame but keep the pending input."""
+
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _run(self) -> None:
+        """Call the callback with the pending input."""
+
+        self._after_id = None
+        args = self._pending
+        if args is None:
+            return
+        self._pending = None
+        self._last_run = time.perf_counter()
+        self._callback(*args)
+
+
+class Debouncer:
+    """Run a callback once submissions have stopped for ``delay`` ms.
+
+    Every :meth:`submit` restarts the timer and replaces the pending
+    arguments, so a burst of input is processed once, with its last value.
+    """
+
+    def __init__(self, widget: Any, callback: Callable[..., None], delay: int) -> None:
+        """Create a debouncer.
+
+        Parameters
+        ----------
+        widget : Any
+            Tk widget used to schedule the callback.
+        callback : Callable[..., None]
+            Function called with the latest submitted arguments.
+        delay : int
+            Quiet period in milliseconds.
+        """
+
+        self._widget = widget
+        self._callback = callback
+        self.delay = int(delay)
+        self._pending: tuple[Any, ...] | None = None
+        self._after_id: str | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether input is waiting for the quiet period to end."""
+
+        return self._pending is not None
+
+    def submit(self, *args: Any) -> None:
+        """Queue ``args`` and restart the quiet period."""
+
+        self._pending = args
+        self._cancel_timer()
+        self._after_id = self._widget.after(self.delay, self._run)
+
+    def flush(self) -> None:
+        """Process the pending input immediately, if there is any."""
+
+        self._cancel_timer()
+        self._run()
+
+    def cancel(self) -> None:
+        """Drop the pending input without processing it."""
+
+        self._cancel_timer()
+        self._pending = None
+
+    def _cancel_timer(self) -> None:
+        """Cancel the timer but keep the pending input."""
+
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _run(self) -> None:
+        """Call the callback with the pending input."""
+
+        self._after_id = None
+        args, self._pending = self._pending, None
+        if args is not None:
+            self._callback(*args)
+
+
+CALLBACK_MODES = ("change", "throttle", "debounce", "release")
+"""Accepted values of the ``callback_mode`` option."""
+
+
+class CallbackDispatcher:
+    """Deliver color changes to a user callback according to a mode.
+
+    ``"change"`` calls the callback for every change, ``"throttle"`` at most
+    ``rate`` times per second with the latest color, ``"debounce"`` once the
+    color has been stable for ``delay`` milliseconds and ``"release"`` only
+    when :meth:`release` is called at the end of a drag. With an
+    ``executor`` the callback runs on a worker thread, at most one call at a
+    time with newer colors superseding queued ones, and its return value is
+    passed to ``on_result`` on the Tk thread.
+    """
+
+    poll_interval = 10
+    """Milliseconds between checks for a finished worker call."""
+
+    def __init__(
+        self,
+        widget: Any,
+        command: Callable[[str], Any],
+        mode: str = "change",
+        rate: float = 30,
+        delay: int = 150,
+        executor: Any | None = None,
+        on_result: Callable[[Any], None] | None = None,
+    ) -> None:
+        """Create a dispatcher.
+
+        Parameters
+        ----------
+        widget : Any
+            Tk widget used to schedule timers.
+        command : Callable[[str], Any]
+            User callback receiving the color string.
+        mode : str
+            One of :data:`CALLBACK_MODES`.
+        rate : float
+            Maximum calls per second in ``"throttle"`` mode.
+        delay : int
+            Quiet period in milliseconds for ``"debounce"`` mode.
+        executor : Any | None
+            :class:`concurrent.futures.Executor` running the callback, or
+            ``None`` to run it on the Tk thread.
+        on_result : Callable[[Any], None] | None
+            Receives the callback's return value on the Tk thread when an
+            executor is used.
+
+        Raises
+        ------
+        ValueError
+            If ``mode`` is not one of :data:`CALLBACK_MODES`.
+        """
+
+        if mode not in CALLBACK_MODES:
+            raise ValueError(
+                f"callback_mode must be one of {', '.join(CALLBACK_MODES)}, "
+                f"got {mode!r}"
+            )
+        self._widget = widget
+        self._command = command
+        self.mode = mode
+        self._delay = int(delay)
+        self._executor = executor
+        self._on_result = on_result
+        self._throttle = LatestWinsScheduler(widget, self._deliver, rate)
+        self._pending: str | None = None
+        self._debounce_id: str | None = None
+        self._future: Any | None = None
+        self._queued: str | None = None
+        self._poll_id: str | None = None
+
+    def __call__(self, value: str) -> None:
+        """Report a color change."""
+
+        if self.mode == "change":
+            self._deliver(value)
+        elif self.mode == "throttle":
+            self._throttle.submit(value)
+        elif self.mode == "debounce":
+            self._pending = value
+            self._cancel_debounce()
+            self._debounce_id = self._widget.after(self._delay, self._fire_pending)
+        else:
+            self._pending = value
+
+    def fire(self, value: str) -> None:
+        """Deliver ``value`` right away, superseding any pending change.
+
+        Used for discrete changes such as a typed hex value.
+        """
+
+        self._throttle.cancel()
+        self._cancel_debounce()
+        self._pending = None
+        self._deliver(value)
+
+    def release(self) -> None:
+        """Deliver the latest pending change at the end of an interaction."""
+
+        self._throttle.flush()
+        self._cancel_debounce()
+        self._fire_pending()
+
+    def cancel(self) -> None:
+        """Drop pending changes and stop waiting for worker results."""
+
+        self._throttle.cancel()
+        self._cancel_debounce()
+        self._pending = None
+        self._queued = None
+        self._future = None
+        if self._poll_id is not None:
+            try:
+                self._widget.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+    def _cancel_debounce(self) -> None:
+        """Cancel the debounce timer."""
+
+        if self._debounce_id is not None:
+            try:
+                self._widget.after_cancel(self._debounce_id)
+            except Exception:
+                pass
+            self._debounce_id = None
+
+    def _fire_pending(self) -> None:
+        """Deliver the pending change, if any."""
+
+        self._debounce_id = None
+        value, self._pending = self._pending, None
+        if value is not None:
+            self._deliver(value)
+
+    def _deliver(self, value: str) -> None:
+        """Call the user callback, directly or on the executor."""
+
+        if self._executor is None:
+            self._command(value)
+            return
+        if self._future is not None:
+            self._queued = value
+            return
+        self._future = self._executor.submit(self._command, value)
+        if self._poll_id is None:
+            self._poll_id = self._widget.after(self.poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        """Hand a finished worker result back on the Tk thread."""
+
+        self._poll_id = None
+        future = self._future
+        if future is None:
+            return
+        if not future.done():
+            self._poll_id = self._widget.after(self.poll_interval, self._poll)
+            return
+        self._future = None
+        error = future.exception()
+        if error is not None:
+            self._widget._root().report_callback_exception(
+                type(error), error, error.__traceback__
+            )
+        elif self._on_result is not None:
+            self._on_result(future.result())
+        value, self._queued = self._queued, None
+        if value is not None:
+            self._deliver(value)
@@ -0,0 +1,260 @@
+"""Palette of color swatches drawn into a single photo image."""
+
+import tkinter
+from typing import Any, Callable, Sequence
+
+import customtkinter
+
+from .color_utils import normalize_hex
+
+
+class SwatchLayout:
+    """Geometry of a grid of ``count`` square cells.
+
+    Cells are ``cell`` pixels wide, separated and surrounded by ``gap``
+    pixels, and laid out row by row in ``columns`` columns. Hit-testing uses
+    per-axis tables built once, so :meth:`hit` is two list lookups.
+    """
+
+    def __init__(self, count: int, columns: int, cell: int, gap: int) -> None:
+        """Compute the layout and the hit-testing tables."""
+
+        self.count = count
+        self.columns = max(1, columns)
+        self.cell = max(1, cell)
+        self.gap = max(0, gap)
+        self.rows = max(1, -(-count // self.columns))
+        pitch = self.cell + self.gap
+        self.width = self.gap + self.columns * pitch
+        self.height = self.gap + self.rows * pitch
+        self._column_at = [self._slot(x) for x in range(self.width)]
+        self._row_at = [self._slot(y) for y in range(self.height)]
+
+    def _slot(self, position: int) -> int:
+        """Return the cell column/row covering ``position``, ``-1`` in gaps."""
+
+        offset = position - self.gap
+        if offset < 0:
+            return -1
+        slot, inner = divmod(offset, self.cell + self.gap)
+        return slot if inner < self.cell else -1
+
+    def box(self, index: int) -> tuple[int, int, int, int]:
+        """Return the ``(x0, y0, x1, y1)`` pixel box of cell ``index``."""
+
+        row, column = divmod(index, self.columns)
+        pitch = self.cell + self.gap
+        x0 = self.gap + column * pitch
+        y0 = self.gap + row * pitch
+        return x0, y0, x0 + self.cell, y0 + self.cell
+
+    def hit(self, x: int, y: int) -> int | None:
+        """Return the index of the cell at ``(x, y)`` or ``None``."""
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        column, row = self._column_at[x], self._row_at[y]
+        if column < 0 or row < 0:
+            return None
+        index = row * self.columns + column
+        return index if index < self.count else None
+
+
+def render_ppm(
+    layout: SwatchLayout,
+    colors: Sequence[tuple[int, int, int] | None],
+    background: tuple[int, int, int],
+) -> bytes:
+    """Return a binary PPM image of the grid.
+
+    ``None`` entries of ``colors`` are drawn in the ``background`` color.
+    Every pixel row of a grid row is identical, so each is built once and
+    repeated.
+    """
+
+    bg = bytes(background)
+    gap = bg * layout.gap
+    blank_line = bg * layout.width
+    lines = [blank_line * layout.gap]
+    for row in range(layout.rows):
+        parts = [gap]
+        for column in range(layout.columns):
+            index = row * layout.columns + column
+            color = colors[index] if index < len(colors) else None
+            parts.append((bytes(color) if color else bg) * layout.cell)
+            parts.append(gap)
+        lines.append(b"".join(parts) * layout.cell)
+        lines.append(blank_line * layout.gap)
+    header = b"P6 %d %d 255\n" % (layout.width, layout.height)
+    return header + b"".join(lines)
+
+
+class SwatchGrid(customtkinter.CTkFrame):
+    """A grid of clickable swatches, e.g. recent colors or a palette.
+
+    All swatches live in one photo image: the first render uploads it as a
+    single PPM, later palette changes only refill the cells that changed.
+    Clicking a swatch selects it, calls ``set_initial_color`` of the linked
+    ``picker`` and then ``command``.
+    """
+
+    def __init__(
+        self,
+        master: Any | None = None,
+        colors: Sequence[str] = (),
+        columns: int = 10,
+        cell_size: int = 20,
+        gap: int = 2,
+        picker: Any | None = None,
+        command: Callable[[str], None] | None = None,
+        fg_color: str | None = None,
+        selection_color: str = "#ffffff",
+        **frame_kwargs: Any,
+    ) -> None:
+        """Create a swatch grid.
+
+        Parameters
+        ----------
+        master : Any | None
+            Parent widget.
+        colors : Sequence[str]
+            Hexadecimal colors of the swatches. Invalid entries are left
+            empty and cannot be selected.
+        columns : int
+            Number of swatches per row.
+        cell_size : int
+            Side length of a swatch in pixels, before widget scaling.
+        gap : int
+            Space between and around swatches in pixels, before scaling.
+        picker : Any | None
+            :class:`AskColor`, :class:`CTkColorPicker` or any object with a
+            ``set_initial_color`` method, updated when a swatch is clicked.
+        command : Callable[[str], None] | None
+            Callback invoked with the color of a clicked swatch.
+        fg_color : str | None
+            Background of the frame and the gaps between swatches.
+        selection_color : str
+            Outline color of the selected swatch.
+        **frame_kwargs : Any
+            Additional keyword arguments passed to the frame.
+        """
+
+        super().__init__(master=master, fg_color=fg_color, **frame_kwargs)
+
+        self.picker = picker
+        self.command = command
+        self.selection_color = selection_color
+        self._columns = columns
+        self._cell = int(self._apply_widget_scaling(cell_size))
+        self._gap = int(self._apply_widget_scaling(gap))
+        self._colors: list[str | None] = []
+        self._selected: int | None = None
+        self._image: tkinter.PhotoImage | None = None
+        self.layout = SwatchLayout(0, columns, self._cell, self._gap)
+
+        self.canvas = tkinter.Canvas(self, highlightthickness=0, borderwidth=0)
+        self.canvas.pack(padx=5, pady=5)
+        self._image_item = self.canvas.create_image(0, 0, anchor="nw")
+        self._selection_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline=selection_color, width=2, state="hidden"
+        )
+        self.canvas.bind("<Button-1>", self._on_click)
+
+        self.set_colors(colors)
+
+    @property
+    def colors(self) -> list[str | None]:
+        """Normalized colors of the swatches, ``None`` for invalid entries."""
+
+        return list(self._colors)
+
+    def set_colors(self, colors: Sequence[str]) -> None:
+        """Show ``colors``, redrawing only the swatches that changed.
+
+        The whole image is rebuilt only when the number of rows changes.
+        """
+
+        new = [normalize_hex(color) for color in colors]
+        layout = SwatchLayout(len(new), self._columns, self._cell, self._gap)
+        if self._image is None or layout.rows != self.layout.rows:
+            self.layout = layout
+            self._colors = new
+            self._render()
+        else:
+            old = self._colors
+            self.layout = layout
+            self._colors = new
+            background = self._background()
+            for index in range(max(len(old), len(new))):
+                before = old[index] if index < len(old) else None
+                after = new[index] if index < len(new) else None
+                if before != after:
+                    self._image.put(after or background, to=layout.box(index))
+        if self._selected is not None and self._selected >= len(new):
+            self._selected = None
+        self._draw_selection()
+
+    def select(self, index: int | None) -> str | None:
+        """Select swatch ``index`` and drive the linked picker.
+
+        Returns
+        -------
+        str | None
+            The selected color, or ``None`` if ``index`` is not a valid
+            swatch.
+        """
+
+        color = self._colors[index] if index is not None else None
+        if color is None:
+            return None
+        self._selected = index
+        self._draw_selection()
+        if self.picker is not None:
+            self.picker.set_initial_color(color)
+        if self.command:
+            self.command(color)
+        return color
+
+    def _on_click(self, event: tkinter.Event) -> None:
+        """Select the swatch under the mouse."""
+
+        self.select(self.layout.hit(event.x, event.y))
+
+    def _background(self) -> str:
+        """Return the color drawn between and behind the swatches."""
+
+        color = self._apply_appearance_mode(self._fg_color)
+        if color == "transparent":
+            color = self._apply_appearance_mode(self._bg_color)
+        return color
+
+    def _render(self) -> None:
+        """Upload the whole grid as one image."""
+
+        background = self._background()
+        bg_rgb = tuple(channel >> 8 for channel in self.winfo_rgb(background))
+        rgb = [
+            tuple(int(color[i : i + 2], 16) for i in (1, 3, 5)) if color else None
+            for color in self._colors
+        ]
+        data = render_ppm(self.layout, rgb, bg_rgb)
+        self._image = tkinter.PhotoImage(master=self, data=data, format="PPM")
+        self.canvas.configure(
+            width=self.layout.width, height=self.layout.height, bg=background
+        )
+        self.canvas.itemconfigure(self._image_item, image=self._image)
+
+    def _draw_selection(self) -> None:
+        """Outline the selected swatch, if any."""
+
+        if self._selected is None:
+            self.canvas.itemconfigure(self._selection_item, state="hidden")
+            return
+        x0, y0, x1, y1 = self.layout.box(self._selected)
+        self.canvas.coords(self._selection_item, x0, y0, x1 - 1, y1 - 1)
+        self.canvas.itemconfigure(self._selection_item, state="normal")
+
+    def _set_appearance_mode(self, mode_string: str) -> None:
+        super()._set_appearance_mode(mode_string)
+        if self._image is not None:
+            self._render()
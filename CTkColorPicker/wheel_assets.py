@@ -0,0 +1,389 @@
+"""Process-wide cache of the wheel and target images shared by all pickers."""
+
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+import PIL
+from PIL import Image, ImageTk
+
+from . import instrumentation
+from .instrumentation import stopwatch
+from .lookup_cache import file_digest, load_hue_to_angle_lookup
+from .lru import CacheInfo, LRUCache
+from .oklch_wheel import DISPLAY_BRIGHTNESS, build_oklch_index
+from .picker_model import COLOR_SPACES
+from .wheel_index import WheelIndex
+from .wheel_renderer import HAS_NUMPY, render_wheel
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+
+DEFAULT_CACHE_SIZE = 8
+"""Number of asset sets kept before the least recently used one is evicted."""
+
+DEFAULT_RENDERER = "procedural" if HAS_NUMPY else "image"
+"""Wheel source used when none is requested: rendered with NumPy when it is
+installed, otherwise resampled from the bundled ``color_wheel.png``."""
+
+SHADE_CACHE_SIZE = 8
+"""Number of brightness-scaled wheel images kept per wheel size."""
+
+PREWARM_WORKERS = 2
+"""Threads of the pool used by :func:`prewarm` when no executor is given."""
+
+PREVIEW_RESOLUTION = 64
+"""Side length of the low-resolution wheel stretched over the canvas while a
+resizable picker is being resized."""
+
+MIN_WHEEL_SIZE = 100
+"""Smallest wheel, before scaling, of a resizable picker."""
+
+
+@dataclass(frozen=True)
+class PreparedAssets:
+    """The Tk-independent part of :class:`WheelAssets`.
+
+    Built by :func:`prepare_assets`, possibly on a worker thread; only the
+    photo images are left for the Tk thread.
+    """
+
+    wheel_image: Image.Image
+    target_image: Image.Image
+    hue_lookup: tuple[Sequence[float], Sequence[float]] | None
+    index: WheelIndex | None
+    color_space: str = "hsv"
+
+
+@dataclass(frozen=True)
+class WheelAssets:
+    """Resized images, Tk photo images and lookup tables for one wheel size.
+
+    Instances are shared between pickers and must be treated as read-only.
+    ``hue_lookup`` is ``None`` for procedural wheels, whose angle to hue
+    mapping is exact. ``index`` is only built for OKLCH wheels.
+    ``wheel_image`` shows the colors at slider value ``base_brightness``:
+    full value on HSV wheels, :data:`oklch_wheel.DISPLAY_BRIGHTNESS` on
+    OKLCH wheels.
+    """
+
+    wheel_image: Image.Image
+    target_image: Image.Image
+    wheel: ImageTk.PhotoImage
+    target: ImageTk.PhotoImage
+    hue_lookup: tuple[Sequence[float], Sequence[float]] | None
+    index: WheelIndex | None
+    color_space: str = "hsv"
+    base_brightness: int = 255
+    shades: "OrderedDict[int, Image.Image]" = field(
+        default_factory=OrderedDict, compare=False, repr=False
+    )
+
+
+_cache = LRUCache(DEFAULT_CACHE_SIZE)
+_prepared: "OrderedDict[tuple, Future[PreparedAssets]]" = OrderedDict()
+_prepared_lock = threading.Lock()
+_executor: Executor | None = None
+
+
+def _load_resized(name: str, dimension: int) -> Image.Image:
+    """Open a bundled image and resize it to ``dimension`` square pixels."""
+
+    with Image.open(os.path.join(PATH, name)) as img:
+        return img.resize((dimension, dimension), Image.Resampling.LANCZOS)
+
+
+@functools.lru_cache(maxsize=None)
+def _source_key(name: str) -> str:
+    """Identify a bundled image and the Pillow build that resamples it."""
+
+    return f"{file_digest(os.path.join(PATH, name))}:{PIL.__version__}"
+
+
+def _check_renderer(renderer: str | None) -> str:
+    """Return ``renderer`` or the default, rejecting unknown names."""
+
+    renderer = DEFAULT_RENDERER if renderer is None else renderer
+    if renderer not in ("procedural", "image"):
+        raise ValueError(f"unknown wheel renderer: {renderer!r}")
+    return renderer
+
+
+def _check_color_space(color_space: str) -> str:
+    """Return ``color_space``, rejecting unknown names."""
+
+    if color_space not in COLOR_SPACES:
+        raise ValueError(f"unknown color space: {color_space!r}")
+    return color_space
+
+
+def _prepare(
+    image_dimension: int,
+    target_dimension: int,
+    renderer: str,
+    color_space: str = "hsv",
+) -> PreparedAssets:
+    """Decode, resize or render the images and build the lookup tables."""
+
+    watch = stopwatch("assets")
+    if color_space == "oklch":
+        index = build_oklch_index(image_dimension)
+        watch.lap("index")
+        wheel_image = index.render(DISPLAY_BRIGHTNESS)
+        watch.lap("wheel")
+        target_image = _load_resized("target.png", target_dimension)
+        watch.stop("target")
+        return PreparedAssets(wheel_image, target_image, None, index, color_space)
+    if renderer == "procedural":
+        wheel_image = render_wheel(image_dimension)
+        hue_lookup = None
+        watch.lap("wheel")
+    else:
+        wheel_image = _load_resized("color_wheel.png", image_dimension)
+        watch.lap("wheel")
+        hue_lookup = load_hue_to_angle_lookup(
+            wheel_image, key=_source_key("color_wheel.png")
+        )
+        watch.lap("lookup")
+    target_image = _load_resized("target.png", target_dimension)
+    watch.stop("target")
+    return PreparedAssets(wheel_image, target_image, hue_lookup, None)
+
+
+def prepare_assets(
+    image_dimension: int,
+    target_dimension: int,
+    renderer: str | None = None,
+    executor: Executor | None = None,
+    color_space: str = "hsv",
+) -> "Future[PreparedAssets]":
+    """Return a future of the prepared assets for one wheel size.
+
+    Requests for the same dimensions and renderer share one future, so a
+    picker constructed while the work is in flight waits for it instead of
+    repeating it.
+
+    Parameters
+    ----------
+    image_dimension : int
+        Scaled side length of the wheel in pixels.
+    target_dimension : int
+        Scaled side length of the target marker in pixels.
+    renderer : str | None
+        Wheel source, see :func:`get_wheel_assets`.
+    executor : Executor | None
+        Executor running the work. ``None`` runs it right away on the
+        calling thread and returns a finished future.
+    color_space : str
+        ``"hsv"`` or ``"oklch"``; OKLCH wheels are always rendered and
+        ignore ``renderer``.
+
+    Returns
+    -------
+    Future[PreparedAssets]
+        Future of the prepared assets.
+    """
+
+    renderer = _check_renderer(renderer)
+    color_space = _check_color_space(color_space)
+    key = (image_dimension, target_dimension, renderer, color_space)
+    with _prepared_lock:
+        future = _prepared.get(key)
+        if future is not None and not (future.done() and future.exception()):
+            _prepared.move_to_end(key)
+            return future
+        if executor is not None:
+            future = executor.submit(
+                _prepare, image_dimension, target_dimension, renderer, color_space
+            )
+        else:
+            future = Future()
+        _prepared[key] = future
+        while len(_prepared) > _cache.maxsize:
+            _prepared.popitem(last=False)
+    if executor is None:
+        try:
+            future.set_result(
+                _prepare(image_dimension, target_dimension, renderer, color_space)
+            )
+        except BaseException as error:
+            future.set_exception(error)
+    return future
+
+
+def prewarm(
+    sizes: Iterable[int] = (300,),
+    scaling: float = 1.0,
+    renderer: str | None = None,
+    executor: Executor | None = None,
+    color_space: str = "hsv",
+) -> "list[Future[PreparedAssets]]":
+    """Prepare the assets of pickers of the given widths in the background.
+
+    Call this at application start so the first picker only has to create
+    its photo images. Pickers constructed later pick up finished results or
+    wait for the ones still in flight.
+
+    Parameters
+    ----------
+    sizes : Iterable[int]
+        ``width`` values of the pickers that will be created.
+    scaling : float
+        Widget scaling of :class:`CTkColorPicker` or window scaling of
+        :class:`AskColor`, e.g. ``customtkinter.ScalingTracker``'s value for
+        the root window.
+    renderer : str | None
+        Wheel source, see :func:`get_wheel_assets`.
+    executor : Executor | None
+        Executor running the work. Defaults to a shared pool of
+        :data:`PREWARM_WORKERS` daemon threads.
+    color_space : str
+        ``color_space`` of the pickers that will be created.
+
+    Returns
+    -------
+    list[Future[PreparedAssets]]
+        One future per size.
+    """
+
+    global _executor
+
+    if executor is None:
+        with _prepared_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    PREWARM_WORKERS, thread_name_prefix="CTkColorPicker-prewarm"
+                )
+            executor = _executor
+    target_dimension = int(20 * scaling)
+    return [
+        prepare_assets(
+            int((max(width, 200) - 100) * scaling),
+            target_dimension,
+            renderer,
+            executor,
+            color_space,
+        )
+        for width in sizes
+    ]
+
+
+def get_wheel_assets(
+    master: Any,
+    image_dimension: int,
+    target_dimension: int,
+    scaling: float = 1.0,
+    renderer: str | None = None,
+    color_space: str = "hsv",
+) -> WheelAssets:
+    """Return the shared assets for a wheel of ``image_dimension`` pixels.
+
+    Parameters
+    ----------
+    master : Any
+        Widget whose Tk interpreter owns the photo images.
+    image_dimension : int
+        Scaled side length of the wheel in pixels.
+    target_dimension : int
+        Scaled side length of the target marker in pixels.
+    scaling : float
+        Scaling factor the dimensions were computed with.
+    renderer : str | None
+        ``"procedural"`` to rasterize the wheel with NumPy or ``"image"`` to
+        resample ``color_wheel.png``. Defaults to :data:`DEFAULT_RENDERER`.
+    color_space : str
+        ``"hsv"`` or ``"oklch"``; the OKLCH wheel needs NumPy.
+
+    Returns
+    -------
+    WheelAssets
+        Cached assets, built on the first request for this key from the
+        result of :func:`prepare_assets`.
+    """
+
+    renderer = _check_renderer(renderer)
+    color_space = _check_color_space(color_space)
+    key = (image_dimension, target_dimension, scaling, renderer, color_space, master.tk)
+    assets = _cache.get(key)
+    if assets is not None:
+        return assets
+
+    prepared = prepare_assets(
+        image_dimension, target_dimension, renderer, color_space=color_space
+    ).result()
+    start = time.perf_counter() if instrumentation.enabled else None
+    assets = WheelAssets(
+        wheel_image=prepared.wheel_image,
+        target_image=prepared.target_image,
+        wheel=ImageTk.PhotoImage(prepared.wheel_image, master=master),
+        target=ImageTk.PhotoImage(prepared.target_image, master=master),
+        hue_lookup=prepared.hue_lookup,
+        index=prepared.index,
+        color_space=prepared.color_space,
+        base_brightness=DISPLAY_BRIGHTNESS if color_space == "oklch" else 255,
+    )
+    if start is not None:
+        instrumentation.record("assets.photo", time.perf_counter() - start)
+    _cache.put(key, assets)
+    return assets
+
+
+def shaded_wheel_image(assets: WheelAssets, brightness: int) -> Image.Image:
+    """Return the wheel image darkened to a 0..255 ``brightness``.
+
+    Scaled images are produced with a single :meth:`Image.Image.point` pass
+    over the base wheel and the most recent ones are kept with the assets.
+    OKLCH wheels are rendered again at the slider's lightness instead, since
+    their gamut boundary changes with it.
+    """
+
+    if brightness == assets.base_brightness or (
+        assets.color_space == "hsv" and brightness >= 255
+    ):
+        return assets.wheel_image
+    image = assets.shades.get(brightness)
+    if image is not None:
+        assets.shades.move_to_end(brightness)
+        return image
+    if assets.color_space == "oklch":
+        image = assets.index.render(brightness)
+    else:
+        scale = [(i * brightness + 127) // 255 for i in range(256)]
+        bands = len(assets.wheel_image.getbands())
+        table = scale * 3 + list(range(256)) * (bands - 3)
+        image = assets.wheel_image.point(table)
+    assets.shades[brightness] = image
+    while len(assets.shades) > SHADE_CACHE_SIZE:
+        assets.shades.popitem(last=False)
+    return image
+
+
+def cache_info() -> CacheInfo:
+    """Return hit, miss and eviction counters of the asset cache."""
+
+    return _cache.info()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Change the number of asset sets kept, evicting the oldest if needed."""
+
+    _cache.resize(maxsize)
+    with _prepared_lock:
+        while len(_prepared) > _cache.maxsize:
+            _prepared.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop every cached and prepared asset set and reset the statistics.
+
+    Pickers that are still alive keep their own references, so clearing is
+    always safe.
+    """
+
+    _cache.clear()
+    with _prepared_lock:
+        _prepared.clear()
@@ -0,0 +1,69 @@
+"""Per-pixel hue/saturation index for constant-time wheel hit-testing."""
+
+from array import array
+
+from .color_utils import projection_on_circle
+
+HUE_LEVELS = 65536
+"""Hue quantization steps; hue ``q`` stands for ``q / HUE_LEVELS``."""
+
+SAT_LEVELS = 65535
+"""Saturation quantization steps; saturation ``q`` stands for ``q / SAT_LEVELS``."""
+
+
+class WheelIndex:
+    """Quantized hue and saturation of every pixel of a square wheel.
+
+    Pixels outside the disc hold the hue of their angle and full saturation,
+    i.e. the color of the nearest point on the rim. Subclasses provide the
+    color of each pixel through :meth:`rgb`; see
+    :class:`~CTkColorPicker.oklch_wheel.OklchWheelIndex`.
+    """
+
+    def __init__(self, size: int, hue: array, sat: array) -> None:
+        """Wrap prebuilt ``uint16`` tables."""
+
+        self.size = size
+        self.hue = hue
+        self.sat = sat
+
+    def clamp(self, x: float, y: float) -> tuple[float, float]:
+        """Return ``(x, y)`` moved onto the rim if it lies outside the wheel.
+
+        The inside test reads the pixel :meth:`pixel` would, so a kept
+        position never maps to a rim pixel.
+        """
+
+        size = self.size
+        c = size / 2
+        xi, yi = int(round(x)), int(round(y))
+        if 0 <= xi < size and 0 <= yi < size:
+            if self.sat[yi * size + xi] < SAT_LEVELS:
+                return x, y
+        return projection_on_circle(x, y, c, c, c - 1)
+
+    def pixel(self, x: float, y: float) -> int:
+        """Return the flat index of the pixel at ``(x, y)``.
+
+        Positions outside the canvas are projected onto the rim first.
+        """
+
+        size = self.size
+        xi, yi = int(round(x)), int(round(y))
+        if not (0 <= xi < size and 0 <= yi < size):
+            c = size / 2
+            px, py = projection_on_circle(x, y, c, c, c - 1)
+            xi = min(max(int(round(px)), 0), size - 1)
+            yi = min(max(int(round(py)), 0), size - 1)
+        return yi * size + xi
+
+    def hue_sat(self, x: float, y: float) -> tuple[float, float]:
+        """Return the hue and saturation (0..1) shown at ``(x, y)``."""
+
+        i = self.pixel(x, y)
+        return self.hue[i] / HUE_LEVELS, self.sat[i] / SAT_LEVELS
+
+    def rgb(self, x: float, y: float, brightness: int) -> tuple[int, int, int]:
+        """Return the integer RGB color at ``(x, y)`` for a 0..255 brightness."""
+
+        raise NotImplementedError
@@ -0,0 +1,95 @@
+"""Procedural rendering of the HSV color wheel.
+
+The wheel is rasterized straight from the geometry used by
+:func:`color_utils.update_colors`: the hue is the polar angle measured
+counter-clockwise from the positive x axis and the saturation is the distance
+from the center divided by ``size / 2 - 1``. Every pixel therefore shows
+exactly the color that picking it returns, and no hue lookup is needed.
+"""
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from .color_batch import _hsv_to_rgb_array
+from .color_utils import TAU
+
+HAS_NUMPY = np is not None
+"""Whether the procedural renderer is available."""
+
+DEFAULT_SUPERSAMPLE = 4
+"""Subsamples per axis used to antialias the rim of the wheel."""
+
+
+def render_wheel(
+    size: int, supersample: int = DEFAULT_SUPERSAMPLE, value: float = 1.0
+) -> Image.Image:
+    """Rasterize a ``size`` x ``size`` RGBA HSV wheel.
+
+    Parameters
+    ----------
+    size : int
+        Side length of the image in pixels.
+    supersample : int
+        Subsamples per axis used to compute the coverage of rim pixels.
+        ``1`` disables antialiasing.
+    value : float
+        HSV value (brightness) of the rendered colors, 0..1.
+
+    Returns
+    -------
+    Image.Image
+        RGBA image whose pixels outside the disc are transparent.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    if np is None:
+        raise ImportError("render_wheel requires NumPy")
+
+    angle, sat = _polar_grid(size)
+    rgb = _hsv_to_rgb_array(angle / TAU, sat, value)
+
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    pixels[..., :3] = np.rint(rgb * 255)
+    pixels[..., 3] = _rim_alpha(size, supersample)
+    return Image.fromarray(pixels, "RGBA")
+
+
+def _polar_grid(size: int) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return the angle (0..2π) and the relative radius (0..1) of every
+    pixel of a ``size`` pixel wheel, the latter clipped to the rim."""
+
+    c = size / 2
+    coords = np.arange(size, dtype=np.float64) - c
+    dx = coords[np.newaxis, :]
+    dy = -coords[:, np.newaxis]
+    return np.arctan2(dy, dx) % TAU, np.minimum(np.hypot(dx, dy) / (c - 1), 1.0)
+
+
+def _rim_alpha(size: int, supersample: int = DEFAULT_SUPERSAMPLE) -> "np.ndarray":
+    """Return the ``uint8`` disc coverage of every pixel of a wheel.
+
+    Only pixels whose square straddles the rim are supersampled.
+    """
+
+    c = size / 2
+    coords = np.arange(size, dtype=np.float64) - c
+    radius = np.hypot(coords[np.newaxis, :], coords[:, np.newaxis])
+    edge = c - 0.5
+    coverage = (radius <= edge).astype(np.float64)
+    supersample = max(1, int(supersample))
+    if supersample > 1:
+        rows, cols = np.nonzero(np.abs(radius - edge) < 0.75)
+        offsets = (np.arange(supersample) + 0.5) / supersample - 0.5
+        sub_x = coords[cols, np.newaxis, np.newaxis] + offsets[np.newaxis, :]
+        sub_y = coords[rows, np.newaxis, np.newaxis] + offsets[:, np.newaxis]
+        inside = sub_x * sub_x + sub_y * sub_y <= edge * edge
+        coverage[rows, cols] = inside.mean(axis=(1, 2))
+    return np.rint(coverage * 255).astype(np.uint8)